@@ -0,0 +1,183 @@
+// Theme Toggle
+const themeToggle = document.getElementById('themeToggle');
+const themeIcon = document.getElementById('themeIcon');
+const html = document.documentElement;
+
+// Load saved theme
+const savedTheme = localStorage.getItem('theme') || 'dark';
+html.setAttribute('data-theme', savedTheme);
+updateThemeIcon(savedTheme);
+
+themeToggle.addEventListener('click', () => {
+    const currentTheme = html.getAttribute('data-theme');
+    const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+    html.setAttribute('data-theme', newTheme);
+    localStorage.setItem('theme', newTheme);
+    updateThemeIcon(newTheme);
+});
+
+function updateThemeIcon(theme) {
+    themeIcon.textContent = theme === 'dark' ? '🌙' : '☀️';
+}
+
+// Search (pages de listing uniquement)
+// L'index prébuilt (search.json) est chargé au premier focus ; la recherche est différée pendant la frappe
+const searchInput = document.getElementById('searchInput');
+
+if (searchInput) {
+    const root = searchInput.dataset.root;
+    const searchResults = document.getElementById('searchResults');
+    const noResults = document.getElementById('noResults');
+    const listingContent = document.querySelectorAll('.listing-content');
+    const MAX_RESULTS = 50;
+    let searchIndex = null;
+    let indexRequest = null;
+    let debounceTimer = null;
+
+    function loadSearchIndex() {
+        if (!indexRequest) {
+            indexRequest = fetch(root + 'search.json')
+                .then(response => response.json())
+                .then(data => {
+                    data.stopwords = new Set(data.stopwords);
+                    searchIndex = data;
+                });
+        }
+        return indexRequest;
+    }
+
+    // Même normalisation que fold_text() dans generate.py
+    function foldText(text) {
+        return text.toLowerCase()
+            .normalize('NFKD')
+            .replace(/[\u0300-\u036f]/g, '')
+            .replace(/œ/g, 'oe')
+            .replace(/æ/g, 'ae');
+    }
+
+    function escapeHtml(text) {
+        return text.replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'})[c]);
+    }
+
+    // Listes d'articles encodées en écarts : décodées une seule fois, à la première utilisation
+    function postingsAt(position) {
+        let ids = searchIndex.postings[position];
+        if (!ids.decoded) {
+            for (let i = 1; i < ids.length; i++) {
+                ids[i] += ids[i - 1];
+            }
+            ids.decoded = true;
+        }
+        return ids;
+    }
+
+    // Premier terme >= token dans la plage [start, end[ des termes triés
+    function lowerBound(terms, token, start, end) {
+        while (start < end) {
+            const middle = (start + end) >> 1;
+            if (terms[middle] < token) {
+                start = middle + 1;
+            } else {
+                end = middle;
+            }
+        }
+        return start;
+    }
+
+    function search(query) {
+        // Comme tokenize() à l'indexation : les mots d'un seul caractère, les mots vides et les mots plus longs
+        // que max_term_length (jamais indexés) sont ignorés
+        const tokens = [...new Set(foldText(query).match(/[a-z0-9]{2,}/g) || [])]
+            .filter(token => token.length <= searchIndex.max_term_length && !searchIndex.stopwords.has(token));
+        if (tokens.length === 0) {
+            return null;
+        }
+
+        // Un article correspond s'il contient un terme commençant par chaque mot de la requête
+        const terms = searchIndex.terms;
+        const counts = new Uint16Array(searchIndex.docs.length);
+        const lastToken = new Int32Array(searchIndex.docs.length).fill(-1);
+        tokens.forEach((token, tokenIndex) => {
+            const range = searchIndex.prefixes[token.slice(0, 2)];
+            if (!range) {
+                return;
+            }
+            for (let i = lowerBound(terms, token, range[0], range[1]); i < range[1] && terms[i].startsWith(token); i++) {
+                for (const docId of postingsAt(i)) {
+                    if (lastToken[docId] !== tokenIndex) {
+                        lastToken[docId] = tokenIndex;
+                        counts[docId]++;
+                    }
+                }
+            }
+        });
+
+        const matches = [];
+        for (let docId = 0; docId < counts.length && matches.length < MAX_RESULTS; docId++) {
+            if (counts[docId] === tokens.length) {
+                matches.push(searchIndex.docs[docId]);
+            }
+        }
+        return matches;
+    }
+
+    function showResults(matches) {
+        const searching = matches !== null;
+        listingContent.forEach(element => { element.hidden = searching; });
+        searchResults.hidden = !searching;
+        noResults.style.display = searching && matches.length === 0 ? 'block' : 'none';
+        if (!searching) {
+            return;
+        }
+
+        searchResults.innerHTML = matches.map(([title, url, category, date, excerpt]) => `
+            <article class="article-card">
+                <div class="article-meta">
+                    <span class="article-category">${escapeHtml(category)}</span>
+                    <span>•</span>
+                    <span>${escapeHtml(date)}</span>
+                </div>
+                <h3>${escapeHtml(title)}</h3>
+                <p class="article-excerpt">${escapeHtml(excerpt)}</p>
+                <div class="article-card-footer">
+                    <a href="${root}${url}" class="read-more">Lire plus</a>
+                </div>
+            </article>`).join('');
+    }
+
+    function runSearch() {
+        const query = searchInput.value;
+        loadSearchIndex().then(() => showResults(search(query)));
+    }
+
+    searchInput.addEventListener('focus', loadSearchIndex, { once: true });
+
+    searchInput.addEventListener('input', () => {
+        clearTimeout(debounceTimer);
+        debounceTimer = setTimeout(runSearch, 120);
+    });
+}
+
+// Back to Top
+const backToTop = document.getElementById('backToTop');
+
+window.addEventListener('scroll', () => {
+    if (window.pageYOffset > 300) {
+        backToTop.classList.add('visible');
+    } else {
+        backToTop.classList.remove('visible');
+    }
+});
+
+backToTop.addEventListener('click', () => {
+    window.scrollTo({
+        top: 0,
+        behavior: 'smooth'
+    });
+});
+
+// Copy Link
+function copyLink() {
+    navigator.clipboard.writeText(window.location.href);
+    alert('✅ Lien copié dans le presse-papiers !');
+}
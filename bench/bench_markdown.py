@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la conversion Markdown : une instance markdown.Markdown construite
+par article (ancien comportement) contre le convertisseur partagé de generate.py
+"""
+
+import sys
+import time
+import random
+import argparse
+import markdown
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import generate
+from corpus import synthetic_body
+
+def bench(label, convert, bodies):
+    """Chronomètre la conversion de tous les corps et affiche le temps par article"""
+    start = time.perf_counter()
+    for body in bodies:
+        convert(body)
+    elapsed = time.perf_counter() - start
+    per_article = elapsed / len(bodies) * 1000
+    print(f"  {label:<28} {elapsed:8.3f} s   {per_article:7.3f} ms/article")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=1000, help="taille du corpus synthétique")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bodies = [synthetic_body(rng, i) for i in range(args.articles)]
+    print(f"📏 Conversion de {len(bodies)} articles synthétiques")
+
+    # L'ancien comportement en premier : le cache de lexers n'est pas encore installé
+    fresh = bench("instance par article", lambda body: markdown.Markdown(
+        extensions=generate.MARKDOWN_EXTENSIONS).convert(body), bodies)
+    shared = bench("convertisseur partagé", lambda body: generate.get_markdown_converter().convert(body), bodies)
+    print(f"  ⚡ Gain : {fresh / shared:.2f}x")
+
+if __name__ == "__main__":
+    main()
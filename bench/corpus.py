@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Générateur de corpus synthétiques pour les benchmarks : articles au même format
+que _articles/_template.md (frontmatter, titres, code, tableaux, listes, tags)
+"""
+
+import random
+import argparse
+from pathlib import Path
+
+CATEGORIES = ['Web Security', 'Phishing', 'Forensic', 'CTF', 'OSINT', 'DevSecOps', 'Red Team', 'Malware']
+TAGS = [f"tag{i:02d}" for i in range(40)]
+LANGUAGES = ['python', 'bash', 'javascript', 'yaml', 'sql', 'powershell', 'http']
+WORDS = ('attaque serveur requête réseau détection exploit payload vulnérabilité analyse sécurité '
+         'campagne phishing accès données cloud métadonnées contournement protection injection '
+         'authentification session jeton certificat chiffrement journal alerte règle signature').split()
+
+def paragraph(rng, words):
+    """Paragraphe de words mots, avec un peu de mise en forme inline"""
+    tokens = [rng.choice(WORDS) for _ in range(words)]
+    if words > 10:
+        tokens[rng.randrange(words)] = f"`{rng.choice(WORDS)}()`"
+        tokens[rng.randrange(words)] = f"**{rng.choice(WORDS)}**"
+    return ' '.join(tokens).capitalize() + '.'
+
+def code_block(rng, lines):
+    """Bloc de code délimité dans un langage pris au hasard"""
+    lang = rng.choice(LANGUAGES)
+    body = '\n'.join(f"value_{i} = compute('{rng.choice(WORDS)}', {i})  # étape {i}" for i in range(lines))
+    return f"```{lang}\n{body}\n```"
+
+def table(rng, rows):
+    """Tableau d'indicateurs de compromission"""
+    lines = ['| Type | Valeur | Commentaire |', '|------|--------|-------------|']
+    for i in range(rows):
+        lines.append(f"| {rng.choice(['MD5', 'IP', 'URL', 'SHA256'])} | 10.0.{i // 256}.{i % 256} | {rng.choice(WORDS)} |")
+    return '\n'.join(lines)
+
+def synthetic_body(rng, index, sections=None, code_density=0.5, table_rate=0.2):
+    """Corps Markdown d'un article : sections, paragraphes, listes, code et tableaux"""
+    parts = [f"# Article synthétique {index}", "## Introduction", paragraph(rng, rng.randint(40, 120))]
+    for section in range(sections if sections is not None else rng.randint(3, 8)):
+        parts.append(f"## Section {section}")
+        for _ in range(rng.randint(1, 3)):
+            parts.append(paragraph(rng, rng.randint(30, 150)))
+        if rng.random() < 0.4:
+            parts.append('\n'.join(f"- {paragraph(rng, rng.randint(4, 12))}" for _ in range(rng.randint(2, 6))))
+        if rng.random() < code_density:
+            parts.append(f"### Exemple {section}")
+            parts.append(code_block(rng, rng.randint(3, 40)))
+        if rng.random() < table_rate:
+            parts.append(table(rng, rng.randint(2, 30)))
+    parts.append("## Conclusion")
+    parts.append(paragraph(rng, rng.randint(30, 80)))
+    return '\n\n'.join(parts) + '\n'
+
+def synthetic_article(rng, index):
+    """Article complet (frontmatter + corps) avec une taille, une densité de code et des tags variés"""
+    # Distribution des tailles : surtout des articles moyens, quelques très longs
+    sections = min(40, int(rng.lognormvariate(1.6, 0.6)) + 1)
+    code_density = rng.choice([0.0, 0.3, 0.6, 0.9])
+    table_rate = 0.8 if rng.random() < 0.05 else 0.15
+    # Tags selon une loi de puissance : quelques tags très fréquents, une longue traîne
+    tags = sorted({TAGS[min(len(TAGS) - 1, int(rng.paretovariate(1.2)) - 1)] for _ in range(rng.randint(0, 4))})
+
+    frontmatter = [
+        '---',
+        f'title: "Article synthétique {index} : {rng.choice(WORDS)} et {rng.choice(WORDS)}"',
+        f"date: 2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        f"category: {rng.choice(CATEGORIES)}",
+        'author: Benchmark',
+    ]
+    if rng.random() < 0.7:
+        frontmatter.append(f'excerpt: "{paragraph(rng, 20)}"')
+    if tags:
+        frontmatter.append(f"tags: {', '.join(tags)}")
+    frontmatter.append('---')
+    body = synthetic_body(rng, index, sections, code_density, table_rate)
+    return '\n'.join(frontmatter) + '\n\n' + body
+
+def generate_corpus(directory, count, seed=42):
+    """Écrit count articles synthétiques dans directory (créé si besoin) et retourne leurs chemins"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    paths = []
+    for index in range(count):
+        path = directory / f"article-{index:05d}.md"
+        path.write_text(synthetic_article(rng, index), encoding='utf-8')
+        paths.append(path)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('directory', help="dossier de sortie (par exemple /tmp/corpus/_articles)")
+    parser.add_argument('--articles', type=int, default=1000, help="nombre d'articles (défaut : 1000)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.directory, args.articles, args.seed)
+    print(f"📝 {len(paths)} articles synthétiques écrits dans {args.directory}")
+
+if __name__ == "__main__":
+    main()
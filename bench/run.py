@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmarks du générateur sur des corpus synthétiques (100, 1 000, 10 000 articles) :
+chronomètre load_article(), get_related_articles(), generate_article_page(),
+generate_index_page() et des builds complets, puis écrit les résultats en JSON
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import contextlib
+import subprocess
+from pathlib import Path
+from datetime import datetime
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+import generate
+from corpus import generate_corpus
+
+RESULTS_DIR = BENCH_DIR / "results"
+
+# Chemins d'assets fictifs pour le rendu isolé des pages
+FAKE_ASSETS = {'css': 'assets/site.bench.css', 'js': 'assets/site.bench.js', 'fonts': []}
+
+def timed(func, repeat=1):
+    """Meilleur temps (s) sur repeat exécutions de func() et résultat de la dernière"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def measure(results, name, func, items=1, repeat=1):
+    """Enregistre et affiche une mesure (temps total et par élément)"""
+    seconds, result = timed(func, repeat)
+    results[name] = {'total_s': round(seconds, 6), 'items': items, 'per_item_ms': round(seconds * 1000 / items, 4)}
+    print(f"    {name:<28} {seconds:9.3f} s  {seconds * 1000 / items:9.3f} ms/élément  ({items})")
+    return result
+
+def run_build(argv):
+    """Build complet via generate.main(), sortie console masquée"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate.main(argv)
+
+def bench_size(size, args):
+    """Tous les benchmarks pour un corpus de size articles"""
+    print(f"  📚 Corpus de {size} articles")
+    results = {}
+    workdir = Path(tempfile.mkdtemp(prefix=f"bench-{size}-"))
+    cwd = os.getcwd()
+    try:
+        paths = generate_corpus(workdir / "_articles", size, args.seed)
+        os.chdir(workdir)
+
+        # Échauffement : imports Pygments et construction du convertisseur Markdown
+        for path in paths[:5]:
+            generate.load_article(path)
+
+        articles = measure(results, 'load_article', lambda: [generate.load_article(p)[0] for p in paths], size)
+        taxonomy = measure(results, 'build_taxonomy', lambda: generate.build_taxonomy(articles), size, args.repeat)
+        related = measure(results, 'get_related_articles',
+                          lambda: [generate.get_related_articles(a, taxonomy) for a in articles], size, args.repeat)
+        measure(results, 'generate_article_page',
+                lambda: [generate.generate_article_page(a, r, FAKE_ASSETS) for a, r in zip(articles, related)],
+                size, args.repeat)
+        measure(results, 'generate_index_page', lambda: generate.generate_index_page(articles, FAKE_ASSETS),
+                1, args.repeat)
+        del articles, related, taxonomy
+
+        # Build à froid (sans cache de conversion), puis avec le cache mais sans _site/
+        jobs = ['--jobs', str(args.jobs)]
+        shutil.rmtree(workdir / ".cache", ignore_errors=True)
+        measure(results, 'build_full', lambda: run_build(jobs), size)
+        shutil.rmtree(workdir / "_site")
+        measure(results, 'build_full_render_cache', lambda: run_build(jobs), size)
+        measure(results, 'build_incremental_noop', lambda: run_build(jobs + ['--incremental']), size)
+        with open(paths[size // 2], 'a', encoding='utf-8') as f:
+            f.write("\nParagraphe ajouté par le benchmark.\n")
+        measure(results, 'build_incremental_one_edit', lambda: run_build(jobs + ['--incremental']), 1)
+        measure(results, 'build_only_index', lambda: run_build(jobs + ['--only', 'index']), size)
+
+        output_bytes = sum(p.stat().st_size for p in (workdir / "_site").rglob('*') if p.is_file())
+        results['output_bytes'] = output_bytes
+        print(f"    {'taille de _site/':<28} {output_bytes / 1e6:9.2f} Mo")
+    finally:
+        os.chdir(cwd)
+        if args.keep:
+            print(f"    (corpus conservé dans {workdir})")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+def git_revision():
+    """Révision git courante, si disponible"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(previous_path, current):
+    """Affiche le rapport entre deux séries de résultats (> 1 : plus lent qu'avant)"""
+    previous = json.loads(Path(previous_path).read_text(encoding='utf-8'))
+    print(f"⚖️  Comparaison avec {previous_path} ({previous['meta'].get('revision')})")
+    for size, benchmarks in current['results'].items():
+        old_benchmarks = previous['results'].get(size, {})
+        for name, values in benchmarks.items():
+            old = old_benchmarks.get(name)
+            if isinstance(values, dict) and isinstance(old, dict) and old['total_s']:
+                ratio = values['total_s'] / old['total_s']
+                flag = ' ⚠️' if ratio > 1.1 else ''
+                print(f"  {size:>6} {name:<28} {old['total_s']:9.3f} s → {values['total_s']:9.3f} s  ×{ratio:.2f}{flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default='100,1000', help="tailles de corpus, séparées par des virgules "
+                                                            "(défaut : 100,1000 ; ajouter 10000 pour le grand corpus)")
+    parser.add_argument('--jobs', type=int, default=1, help="option --jobs passée aux builds complets")
+    parser.add_argument('--repeat', type=int, default=3, help="répétitions des mesures rapides (meilleur temps)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help="fichier JSON de résultats (défaut : bench/results/bench-<date>.json)")
+    parser.add_argument('--compare', metavar='JSON', help="résultats précédents à comparer")
+    parser.add_argument('--keep', action='store_true', help="conserve les corpus et sites générés")
+    args = parser.parse_args()
+
+    print("🏁 Benchmarks du générateur")
+    current = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'jobs': args.jobs,
+            'seed': args.seed,
+        },
+        'results': {},
+    }
+    for size in [int(s) for s in args.sizes.split(',')]:
+        current['results'][str(size)] = bench_size(size, args)
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"bench-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"💾 Résultats écrits dans {output}")
+
+    if args.compare:
+        compare(args.compare, current)
+
+if __name__ == "__main__":
+    main()
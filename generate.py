@@ -4,90 +4,652 @@ Générateur de blog statique pour CyberInsight - Version Améliorée
 Lit tous les articles markdown du dossier _articles/ et génère le site dans _site/
 """
 
+import io
 import os
 import re
+import ast
+import builtins
+import marshal
+import importlib.util
 import json
+import hashlib
+import time
+import cProfile
+import argparse
+import contextlib
+import functools
+import threading
+import traceback
+import gzip
+import bisect
+import posixpath
+import urllib.request
+import unicodedata
+from html import escape as html_escape, unescape as html_unescape
+from xml.sax.saxutils import escape as xml_escape
+from urllib.parse import urlsplit, unquote
 import markdown
+from markdown.extensions import codehilite
+from concurrent.futures import ProcessPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from datetime import datetime
+from types import GeneratorType
+from collections import Counter
+from datetime import date, datetime
+
+try:
+    import brotli  # Optionnel : variantes .br en plus des .gz, polices WOFF2 sous-ensemblées
+except ImportError:
+    brotli = None
+
+try:
+    from fontTools import subset as font_subset, version as fonttools_version  # Optionnel : sous-ensemble des polices
+except ImportError:
+    font_subset = fonttools_version = None
+
+try:
+    # Optionnel : dimensions des images et variantes WebP/AVIF redimensionnées
+    from PIL import Image, ImageOps, features as pillow_features, __version__ as pillow_version
+except ImportError:
+    Image = ImageOps = pillow_features = pillow_version = None
+
+try:
+    import yaml  # Optionnel : frontmatter complexe (listes, valeurs multilignes), chargeur C si disponible
+except ImportError:
+    yaml = None
 
 # Dossiers
 ARTICLES_DIR = Path("_articles")
 OUTPUT_DIR = Path("_site")
 ARTICLES_OUTPUT = OUTPUT_DIR / "articles"
+ASSETS_DIR = Path(__file__).parent / "_assets"
+ASSETS_OUTPUT = OUTPUT_DIR / "assets"
+
+# Feuilles de style et scripts partagés, publiés sous un nom empreinté (cache immuable)
+SITE_ASSETS = {'css': 'site.css', 'js': 'site.js'}
+
+# Polices auto-hébergées, copiées depuis _vendor/fonts/ sans accès réseau pendant le build. Les fichiers
+# (licence SIL OFL) sont téléchargés une fois par « python generate.py fetch-fonts », depuis les dépôts
+# officiels ci-dessous (JetBrains Mono épinglée sur sa version). S'il en manque, les pages chargent
+# les polices depuis Google Fonts
+VENDOR_DIR = Path(__file__).parent / "_vendor"
+FONTS_OUTPUT = ASSETS_OUTPUT / "fonts"
+POPPINS_SOURCE = "https://github.com/google/fonts/raw/main/ofl/poppins"
+JETBRAINS_MONO_SOURCE = "https://github.com/JetBrains/JetBrainsMono/raw/v2.304"
+VENDOR_FONTS = [
+    # (famille, graisse, fichier dans _vendor/fonts/, préchargée, source TTF ou WOFF2)
+    ('Poppins', 300, 'poppins-300.woff2', False, f"{POPPINS_SOURCE}/Poppins-Light.ttf"),
+    ('Poppins', 400, 'poppins-400.woff2', True, f"{POPPINS_SOURCE}/Poppins-Regular.ttf"),
+    ('Poppins', 600, 'poppins-600.woff2', False, f"{POPPINS_SOURCE}/Poppins-SemiBold.ttf"),
+    ('Poppins', 700, 'poppins-700.woff2', False, f"{POPPINS_SOURCE}/Poppins-Bold.ttf"),
+    ('JetBrains Mono', 400, 'jetbrains-mono-400.woff2', False,
+     f"{JETBRAINS_MONO_SOURCE}/fonts/webfonts/JetBrainsMono-Regular.woff2"),
+    ('JetBrains Mono', 600, 'jetbrains-mono-600.woff2', False,
+     f"{JETBRAINS_MONO_SOURCE}/fonts/webfonts/JetBrainsMono-SemiBold.woff2"),
+    ('JetBrains Mono', 700, 'jetbrains-mono-700.woff2', True,
+     f"{JETBRAINS_MONO_SOURCE}/fonts/webfonts/JetBrainsMono-Bold.woff2"),
+]
+VENDOR_FONT_LICENSES = {
+    'OFL-poppins.txt': f"{POPPINS_SOURCE}/OFL.txt",
+    'OFL-jetbrains-mono.txt': f"{JETBRAINS_MONO_SOURCE}/OFL.txt",
+}
+GOOGLE_FONTS_HTML = ('<link rel="preconnect" href="https://fonts.googleapis.com">\n    '
+                     '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>\n    '
+                     '<link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600;700'
+                     '&family=Poppins:wght@300;400;600;700&display=swap" rel="stylesheet">')
+
+# Sous-ensembles de polices (fontTools + brotli) : caractères du corpus en plus de ce socle
+# (ASCII, Latin-1, ligatures et ponctuation typographique), mis en cache dans .cache/fonts/
+FONT_CACHE_DIR = Path(".cache") / "fonts"
+# Caractères de chaque source (par empreinte) : seules les sources modifiées sont relues pour les collecter
+CHARSET_CACHE_PATH = Path(".cache") / "charset.json"
+FONT_BASE_CHARSET = frozenset(
+    [chr(c) for c in range(0x20, 0x7f)] + [chr(c) for c in range(0xa0, 0x100)]
+    + list('œŒæÆ‘’“”«»–—…•€→←↑↓✓')
+)
+
+# Images référencées par les articles (chemins relatifs à _articles/) : publiées sous un nom empreinté et,
+# si Pillow est installé, déclinées en variantes AVIF/WebP redimensionnées, en cache par empreinte du contenu
+IMAGES_OUTPUT = OUTPUT_DIR / "images"
+IMAGE_CACHE_DIR = Path(".cache") / "images"
+# Empreinte de chaque image par chemin, avec sa clé de changement (voir source_stat) : seules les images
+# dont le fichier a changé sont relues et hachées
+IMAGE_DIGESTS_PATH = Path(".cache") / "image-digests.json"
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.svg')
+IMAGE_WIDTHS = (480, 960, 1440)
+IMAGE_QUALITY = {'avif': 60, 'webp': 80}
+IMAGE_SIZES = "(max-width: 900px) 100vw, 900px"  # Largeur de la colonne des articles (.page-article .container)
+IMAGE_TAG = re.compile(r'<img\b([^>]*?)\s*/?>')
+IMAGE_SRC = re.compile(r'\ssrc="([^"]*)"')
+
+# Manifeste de build (builds incrémentaux)
+MANIFEST_PATH = OUTPUT_DIR / ".manifest.json"
+GENERATOR_VERSION = "2"
+# Termes de recherche de chaque source (par empreinte) : hors de _site/, ils ne sont pas publiés
+TERMS_CACHE_PATH = Path(".cache") / "terms.json"
+
+# Serveur de développement (serve) : scrutation des sources et rechargement des navigateurs par SSE
+WATCH_INTERVAL = 0.05
+LIVE_RELOAD_PATH = "/__reload"
+LIVE_RELOAD_SCRIPT = (
+    b"<script>new EventSource('" + LIVE_RELOAD_PATH.encode() + b"')"
+    b".onmessage = () => location.reload();</script>\n"
+)
+
+# Index des catégories et des tags publié pour les pages et les scripts (nuages de tags, etc.)
+TAXONOMY_PATH = "taxonomy.json"
+
+# Flux Atom et JSON Feed : les FEED_SIZE articles les plus récents
+SITE_URL = "https://voidsponge.github.io"
+FEED_ATOM_PATH = "feed.xml"
+FEED_JSON_PATH = "feed.json"
+FEED_SIZE = 20
+FEED_TAG_AUTHORITY = "voidsponge.github.io,2025"
+
+# Variantes précompressées (servies telles quelles par l'hébergeur, comme gzip_static de nginx)
+COMPRESSIBLE_SUFFIXES = ('.html', '.css', '.js', '.json', '.xml')
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+# Vérification des liens internes et des ancres (--check-links) : analyse des pages en cache par page
+LINK_CACHE_PATH = Path(".cache") / "links.json"
+LINK_REPORT_LIMIT = 50
+HTML_TAG = re.compile(r'''<([a-zA-Z][\w:-]*)((?:[^>"']+|"[^"]*"|'[^']*')*)>''')
+HTML_LINK_ATTRIBUTE = re.compile(r'''\s(id|name|href|src|srcset)\s*=\s*(?:"([^"]*)"|'([^']*)')''', re.IGNORECASE)
+
+# Nombre d'articles par page de listing (accueil, catégories, tags)
+PAGE_SIZE = 12
+
+# Index de recherche côté client, mots ignorés à l'indexation (déjà sans accents) et longueur maximale d'un terme ;
+# les deux sont publiés dans search.json pour que site.js filtre la requête de la même façon
+SEARCH_INDEX_PATH = "search.json"
+SEARCH_TERM_MAX_LENGTH = 32
+SEARCH_STOPWORDS = frozenset(
+    'au aux avec ce ces cet cette dans de des du elle en est et il ils la le les leur leurs lui '
+    'mais me meme ne nos notre nous on ou par pas pour qu que qui sa se ses son sont sur ta te '
+    'tes ton tu un une vos votre vous ete etre avoir fait plus comme si ni '
+    'an the and of to in is it for on with as by be at or this that are from'.split()
+)
+
+# Extensions Markdown utilisées pour tous les articles
+MARKDOWN_EXTENSIONS = ['extra', 'codehilite', 'fenced_code', 'tables', 'toc']
+
+# Styles Pygments de la coloration syntaxique (faite au build par codehilite), par valeur de data-theme
+PYGMENTS_STYLES = {'dark': 'github-dark', 'light': 'default'}
+
+# Cache disque des conversions Markdown (adressé par contenu), purgé des entrées
+# les moins récemment utilisées au-delà de RENDER_CACHE_MAX_BYTES
+RENDER_CACHE_DIR = Path(".cache") / "render"
+RENDER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Frontmatter : en-tête entre deux lignes --- en début de fichier. Les lignes « clé: valeur » simples
+# sont lues directement ; le reste (listes, blocs, ancres...) passe par YAML
+FRONTMATTER_PATTERN = re.compile(r'\A\ufeff?---[ \t]*\r?\n(.*?)^---[ \t]*\r?$', re.DOTALL | re.MULTILINE)
+FRONTMATTER_LINE = re.compile(r'([A-Za-z_][\w-]*)[ \t]*:[ \t]+(\S.*?)[ \t]*\r?')
+FRONTMATTER_YAML_MARKERS = '[{>|&*!%@`'
+
+# Lecture des métadonnées seules (--only index) : début du corps lu au plus, taille moyenne d'un mot dans
+# la source Markdown (estimation du temps de lecture), et cache des résultats par mtime et taille des sources
+SCAN_HEAD_MAX_BYTES = 64 * 1024
+SCAN_BYTES_PER_WORD = 9
+META_CACHE_PATH = Path(".cache") / "meta.json"
+
+# Gabarits des pages (texte statique et emplacements {{ expression }} ou {{ *flux de morceaux }}),
+# compilés en générateurs Python dont le code est mis en cache dans TEMPLATE_CACHE_DIR
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+TEMPLATE_CACHE_DIR = Path(".cache") / "templates"
+TEMPLATE_ENGINE_VERSION = "2"
+TEMPLATE_SLOT = re.compile(r'\{\{\s*(\*?)(.+?)\s*\}\}')
+
+# Métadonnées conservées dans le manifeste (tout sauf le contenu HTML)
+META_FIELDS = ('title', 'category', 'date', 'author', 'excerpt', 'reading_time', 'tags', 'prose_words', 'code_words',
+               'images')
+
+# Longueur de l'extrait généré quand le frontmatter n'en fournit pas
+EXCERPT_LENGTH = 200
 
 def parse_frontmatter(content):
-    """Parse le frontmatter YAML d'un article"""
+    """Parse le frontmatter YAML d'un article : retourne (métadonnées, corps markdown)"""
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return {}, content
+    return parse_frontmatter_header(match.group(1)), content[match.end():].strip()
+
+def read_frontmatter_header(f):
+    """En-tête brut d'un fichier ouvert en binaire (None s'il n'y en a pas) ; le fichier est laissé au début du corps"""
+    if f.readline().removeprefix(b'\xef\xbb\xbf').rstrip() == b'---':
+        lines = []
+        for line in f:
+            if line.rstrip() == b'---':
+                return b''.join(lines).decode('utf-8')
+            lines.append(line)
+    f.seek(0)  # Pas d'en-tête, ou jamais fermé : tout le fichier est du corps, comme dans parse_frontmatter
+    return None
+
+def read_frontmatter(filepath):
+    """Métadonnées d'un article en ne lisant que les lignes de l'en-tête (le corps n'est pas lu)"""
+    with open(filepath, 'rb') as f:
+        header = read_frontmatter_header(f)
+    return {} if header is None else parse_frontmatter_header(header)
+
+def parse_frontmatter_header(header):
+    """Métadonnées d'un en-tête : lignes « clé: valeur » lues directement, YAML complet sinon"""
     frontmatter = {}
-    
-    if content.startswith('---'):
+    for line in header.splitlines():
+        if not line.strip() or line.startswith('#'):
+            continue
+        match = FRONTMATTER_LINE.fullmatch(line)
+        if not match:
+            return parse_yaml_frontmatter(header)
+        key, value = match.groups()
+        if value[0] in FRONTMATTER_YAML_MARKERS or ' #' in value:
+            return parse_yaml_frontmatter(header)
+        if value[0] in '"\'':
+            # Chaîne entre guillemets sans échappement ; sinon c'est à YAML de l'interpréter
+            quote = value[0]
+            if len(value) < 2 or value[-1] != quote or quote in value[1:-1] or (quote == '"' and '\\' in value):
+                return parse_yaml_frontmatter(header)
+            value = value[1:-1]
+        frontmatter[key] = value
+    return frontmatter
+
+def frontmatter_value(value):
+    """Valeur YAML ramenée aux types du frontmatter simple : chaînes (dates AAAA-MM-JJ) ou listes de chaînes"""
+    if isinstance(value, (list, tuple)):
+        return [frontmatter_value(item) for item in value if item is not None]
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    return str(value).strip()
+
+def parse_yaml_frontmatter(header):
+    """En-tête complexe (listes, valeurs multilignes) lu par YAML ; lecture ligne à ligne permissive en dernier recours"""
+    if yaml is not None:
         try:
-            end = content.index('---', 3)
-            front = content[3:end].strip()
-            content = content[end+3:].strip()
-            
-            for line in front.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    frontmatter[key.strip()] = value.strip().strip('"\'')
-        except ValueError:
-            pass
+            data = yaml.load(header, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        except yaml.YAMLError:
+            data = None
+        if isinstance(data, dict):
+            return {str(key): frontmatter_value(value) for key, value in data.items() if value is not None}
     
-    return frontmatter, content
-
-def estimate_reading_time(text):
+    frontmatter = {}
+    for line in header.split('\n'):
+        if ':' in line:
+            key, value = line.split(':', 1)
+            frontmatter[key.strip()] = value.strip().strip('"\'')
+    return frontmatter
+
+@functools.lru_cache(maxsize=None)
+def _get_lexer(name, options):
+    return _find_lexer(name, **dict(options))
+
+def get_cached_lexer(name, **options):
+    """Lexer Pygments mis en cache par langage (un lexer est réutilisable d'un bloc à l'autre)"""
+    return _get_lexer(name, tuple(sorted(options.items())))
+
+def install_lexer_cache():
+    """Fait passer la recherche de lexer de codehilite par le cache (sans effet sans Pygments)"""
+    global _find_lexer
+    if codehilite.pygments and codehilite.get_lexer_by_name is not get_cached_lexer:
+        _find_lexer = codehilite.get_lexer_by_name
+        codehilite.get_lexer_by_name = get_cached_lexer
+
+_markdown_converter = None
+
+def get_markdown_converter():
+    """Convertisseur Markdown partagé : une instance par processus, réinitialisée entre deux documents"""
+    global _markdown_converter
+    if _markdown_converter is None:
+        install_lexer_cache()
+        _markdown_converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    return _markdown_converter.reset()
+
+@functools.lru_cache(maxsize=None)
+def render_cache_salt():
+    """Ce dont dépend le HTML converti, hors source : versions de Markdown et Pygments, extensions"""
+    try:
+        import pygments
+        pygments_version = pygments.__version__
+    except ImportError:
+        pygments_version = None
+    return json.dumps([markdown.__version__, pygments_version, MARKDOWN_EXTENSIONS]).encode('utf-8')
+
+def render_markdown(markdown_content):
+    """Convertit le Markdown en HTML (et table des matières), via le cache disque si possible"""
+    key = hash_bytes(render_cache_salt() + b'\0' + markdown_content.encode('utf-8'))
+    cache_path = RENDER_CACHE_DIR / f"{key[:2]}/{key}.json"
+    try:
+        cached = json.loads(cache_path.read_text(encoding='utf-8'))
+        os.utime(cache_path)  # Entrée récemment utilisée : épargnée par la purge
+        return cached['html'], cached['toc']
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    converter = get_markdown_converter()
+    html_content = converter.convert(markdown_content)
+    toc = getattr(converter, 'toc_tokens', [])
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(cache_path, json.dumps({'html': html_content, 'toc': toc}, ensure_ascii=False))
+    except OSError:
+        pass  # Cache en lecture seule ou plein : la conversion reste valable
+    return html_content, toc
+
+def prune_render_cache(max_bytes=RENDER_CACHE_MAX_BYTES):
+    """Supprime les entrées les moins récemment utilisées jusqu'à repasser sous max_bytes ; retourne leur nombre"""
+    entries = []
+    for path in RENDER_CACHE_DIR.glob("*/*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+def estimate_reading_time(words):
     """Estime le temps de lecture (mots par minute)"""
-    words = len(re.findall(r'\w+', text))
     minutes = max(1, round(words / 200))  # 200 mots par minute
     return minutes
 
-def load_article(filepath):
-    """Charge un article markdown et extrait les métadonnées"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+class TextExtractor:
+    """Texte d'un document HTML en une passe : mots de prose et de blocs de code, début du texte, termes de recherche"""
     
-    frontmatter, markdown_content = parse_frontmatter(content)
+    # Commentaire, bloc <pre> entier (le balisage de la coloration y est retiré d'un coup),
+    # balise (attributs entre guillemets pouvant contenir « > »), ou texte
+    TAG = r'''(?:[^>"']|"[^"]*"|'[^']*')*>'''
+    TOKEN = re.compile(rf'''<!--.*?-->|<pre\b{TAG}(?P<pre>.*?)</pre\s*>|<(?P<closing>/?)(?P<tag>[a-zA-Z][\w:-]*){TAG}|(?P<text>[^<]+|<)''',
+                       re.S | re.I)
+    MARKUP = re.compile(rf'''<!--.*?-->|</?[a-zA-Z][\w:-]*{TAG}''', re.S)
+    WORD = re.compile(r'\w+')
+    # Balises ouvrantes de bloc et <br> : elles terminent un mot (« <td>a</td><td>b</td> »), contrairement aux balises
+    # en ligne qui le prolongent (« <em>cyber</em>sécurité »)
+    BLOCK_TAGS = frozenset('address article aside blockquote br caption dd details div dl dt figcaption figure footer '
+                           'h1 h2 h3 h4 h5 h6 header hr li main nav ol p section summary table tbody td tfoot th '
+                           'thead tr ul'.split())
+    TRAILING_WORD = re.compile(r'\w*\Z')
+    BATCH_SIZE = 8192
     
-    # Extraire le titre du markdown si pas dans frontmatter
-    if 'title' not in frontmatter:
-        title_match = re.search(r'^#\s+(.+)$', markdown_content, re.MULTILINE)
-        if title_match:
-            frontmatter['title'] = title_match.group(1)
+    def __init__(self, head_length=EXCERPT_LENGTH + 1):
+        self.head_length = head_length
+        self.head = []  # Début du texte brut (head_length caractères au plus)
+        self.head_size = 0
+        self.prose_words = 0
+        self.code_words = 0
+        self.terms = set()
+        self.pre_depth = 0
+        self.skip_depth = 0  # Dans <script> ou <style> : pas du texte
+        self.carry = ''  # Mot peut-être coupé par une balise (« <em>cyber</em>sécurité »)
+        self.last_char = ''  # Dernier caractère du texte : une balise de bloc n'ajoute un espace qu'après du texte
+        self.pending = []  # Texte complet en attente, analysé par lots de BATCH_SIZE caractères
+        self.pending_size = 0
     
-    # Générer un slug depuis le nom de fichier
-    slug = filepath.stem
+    def feed(self, html_content):
+        for match in self.TOKEN.finditer(html_content):
+            text, code, tag = match.group('text', 'pre', 'tag')
+            if text is not None:
+                if not self.skip_depth:
+                    self.handle_data(html_unescape(text) if '&' in text else text)
+            elif code is not None:
+                self.flush()
+                self.pre_depth += 1
+                code = self.MARKUP.sub('', code)
+                self.handle_data(html_unescape(code) if '&' in code else code)
+                self.flush()
+                self.pre_depth -= 1
+            elif tag:
+                tag = tag.lower()
+                if tag in ('script', 'style'):
+                    self.skip_depth = max(0, self.skip_depth + (-1 if match.group('closing') else 1))
+                elif (tag in self.BLOCK_TAGS and not match.group('closing') and self.last_char
+                      and not self.last_char.isspace()):
+                    self.handle_data(' ')
     
-    # Convertir le markdown en HTML
-    md = markdown.Markdown(extensions=['extra', 'codehilite', 'fenced_code', 'tables', 'toc'])
-    html_content = md.convert(markdown_content)
+    def handle_data(self, data):
+        if data:
+            self.last_char = data[-1]
+        if self.head_size < self.head_length:
+            self.head.append(data[:self.head_length - self.head_size])
+            self.head_size += len(self.head[-1])
+        text = self.carry + data
+        cut = self.TRAILING_WORD.search(text).start()
+        self.carry = text[cut:]
+        if cut:
+            self.pending.append(text[:cut])
+            self.pending_size += cut
+            if self.pending_size >= self.BATCH_SIZE:
+                self.count()
+    
+    def count(self):
+        """Compte les mots du texte en attente (prose ou code selon le contexte) et en extrait les termes"""
+        text = ' '.join(self.pending)
+        self.pending = []
+        self.pending_size = 0
+        words = len(self.WORD.findall(text))
+        if self.pre_depth:
+            self.code_words += words
+        else:
+            self.prose_words += words
+        self.terms.update(tokenize(text))
+    
+    def flush(self):
+        """Termine le lot en cours (changement de contexte ou fin du document)"""
+        if self.carry:
+            self.pending.append(self.carry)
+            self.carry = ''
+        if self.pending:
+            self.count()
+    
+    def close(self):
+        self.flush()
+
+def extract_text(html_content):
+    """Analyse un document HTML avec TextExtractor"""
+    extractor = TextExtractor()
+    extractor.feed(html_content)
+    extractor.close()
+    return extractor
+
+class Article:
+    """Article du blog : métadonnées résidentes, contenu HTML converti à la demande et libéré après écriture"""
+    __slots__ = META_FIELDS + ('slug', 'filepath', '_content', '_toc')
+    
+    def __init__(self, filepath, **meta):
+        self.slug = filepath.stem
+        self.filepath = filepath
+        for field in META_FIELDS:
+            setattr(self, field, meta[field])
+        self._content = self._toc = None
+    
+    def __repr__(self):
+        return f"Article({self.slug!r})"
+    
+    def _render(self):
+        _, markdown_content = parse_frontmatter(self.filepath.read_text(encoding='utf-8'))
+        self._content, self._toc = render_markdown(markdown_content)
     
-    # Extraire un excerpt des premiers 200 caractères
-    plain_text = re.sub('<[^<]+?>', '', html_content)
-    excerpt = plain_text[:200].strip() + '...' if len(plain_text) > 200 else plain_text
+    @property
+    def content(self):
+        """HTML converti (relu depuis le cache de conversion, ou reconverti)"""
+        if self._content is None:
+            self._render()
+        return self._content
     
-    # Calculer le temps de lecture
-    reading_time = estimate_reading_time(plain_text)
+    @property
+    def toc(self):
+        """Table des matières (jetons de l'extension toc)"""
+        if self._toc is None:
+            self._render()
+        return self._toc
     
-    # Parser les tags s'ils existent
-    tags = []
-    if 'tags' in frontmatter:
-        tags = [tag.strip() for tag in frontmatter['tags'].split(',')]
+    def release(self):
+        """Libère le contenu HTML une fois la page écrite"""
+        self._content = self._toc = None
+
+def article_fields(frontmatter, markdown_content, head, prose_words, code_words, images):
+    """Champs META_FIELDS d'un article : frontmatter, valeurs par défaut et valeurs tirées du texte (head : son début)"""
+    # Extraire le titre du markdown si pas dans frontmatter
+    title = frontmatter.get('title')
+    if title is None:
+        title_match = re.search(r'^#\s+(.+)$', markdown_content, re.MULTILINE)
+        title = title_match.group(1) if title_match else 'Sans titre'
+    
+    # Extraire un excerpt des premiers caractères (échappé : il est inséré tel quel dans les pages)
+    excerpt = head[:EXCERPT_LENGTH].strip() + '...' if len(head) > EXCERPT_LENGTH else head
+    excerpt = html_escape(excerpt, quote=False)
+    
+    # Parser les tags s'ils existent (« tags: a, b » ou liste YAML)
+    tags = frontmatter.get('tags', [])
+    if isinstance(tags, str):
+        tags = tags.split(',')
     
     return {
-        'title': frontmatter.get('title', 'Sans titre'),
-        'slug': slug,
+        'title': title,
         'category': frontmatter.get('category', 'Général'),
         'date': frontmatter.get('date', datetime.now().strftime('%Y-%m-%d')),
         'author': frontmatter.get('author', 'CyberInsight'),
         'excerpt': frontmatter.get('excerpt', excerpt),
-        'content': html_content,
-        'reading_time': reading_time,
-        'tags': tags,
-        'filepath': filepath
+        'reading_time': estimate_reading_time(prose_words + code_words),
+        'tags': [tag.strip() for tag in tags if tag.strip()],
+        'prose_words': prose_words,
+        'code_words': code_words,
+        'images': images,
     }
 
+def truncate_excerpt(excerpt, length):
+    """Début d'un extrait HTML (length caractères de texte), rééchappé : aucune entité n'est coupée"""
+    return html_escape(html_unescape(excerpt)[:length])
+
+def load_article(filepath):
+    """Charge un article markdown et extrait les métadonnées (le contenu HTML n'est pas conservé) ;
+    retourne l'article et ses termes de recherche, à verser aussitôt dans les listes de l'index"""
+    # Générer un slug depuis le nom de fichier
+    slug = filepath.stem
+    
+    with profile_stage('frontmatter', slug):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        frontmatter, markdown_content = parse_frontmatter(content)
+    
+    # Convertir le markdown en HTML
+    with profile_stage('markdown', slug):
+        html_content, _ = render_markdown(markdown_content)
+    
+    with profile_stage('texte', slug):
+        text = extract_text(html_content)
+        article = Article(filepath, **article_fields(frontmatter, markdown_content, ''.join(text.head),
+                                                     text.prose_words, text.code_words,
+                                                     local_image_sources(html_content)))
+        
+        # Termes indexés pour la recherche (texte intégral, déjà découpé par l'extracteur)
+        # L'extrait est du HTML : ses entités (&amp;, &lt;…) ne doivent pas devenir des termes
+        searchable = ' '.join([article.title, article.category, html_unescape(article.excerpt), ' '.join(article.tags)])
+        terms = sorted(text.terms.union(tokenize(searchable)))
+    return article, terms
+
+def read_article_head(f):
+    """Début du corps Markdown (titres compris) jusqu'à la fin du paragraphe qui couvre l'extrait, ligne par ligne"""
+    lines = []
+    size = length = 0
+    fence = None  # Marqueur du bloc de code délimité en cours : ses lignes vides ne terminent pas un paragraphe
+    for raw in f:
+        line = raw.decode('utf-8')
+        stripped = line.strip()
+        if stripped.startswith(('```', '~~~')):
+            if fence is None:
+                fence = stripped[:3]
+            elif stripped.startswith(fence):
+                fence = None
+        elif not stripped and fence is None and length > 2 * EXCERPT_LENGTH:
+            break
+        lines.append(line)
+        length += len(stripped)
+        size += len(raw)
+        if size > SCAN_HEAD_MAX_BYTES:
+            break
+    return ''.join(lines).strip()
+
+def scan_article(filepath):
+    """Métadonnées d'un article sans conversion complète : frontmatter et premier paragraphe, en lectures partielles
+    (le temps de lecture est estimé d'après la taille du fichier)"""
+    with open(filepath, 'rb') as f:
+        header = read_frontmatter_header(f)
+        frontmatter = {} if header is None else parse_frontmatter_header(header)
+        body_size = os.fstat(f.fileno()).st_size - f.tell()
+        markdown_head = read_article_head(f)
+    
+    html_head = get_markdown_converter().convert(markdown_head)
+    text = extract_text(html_head)
+    return article_fields(frontmatter, markdown_head, ''.join(text.head), body_size // SCAN_BYTES_PER_WORD, 0,
+                          local_image_sources(html_head))
+
+# Diacritiques retirés après décomposition (même plage que foldText() dans site.js)
+COMBINING_MARKS = re.compile('[\u0300-\u036f]')
+
+def fold_text(text):
+    """Minuscules sans accents ni ligatures (é → e, œ → oe), comme foldText() dans site.js"""
+    text = text.lower()
+    if text.isascii():
+        return text
+    text = COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', text))
+    return text.replace('œ', 'oe').replace('æ', 'ae')
+
+def tokenize(text):
+    """Découpe un texte en termes de recherche normalisés, sans les mots vides"""
+    return [token for token in re.findall(r'[a-z0-9]+', fold_text(text))
+            if 1 < len(token) <= SEARCH_TERM_MAX_LENGTH and token not in SEARCH_STOPWORDS]
+
+def add_postings(postings, terms, slug):
+    """Verse les termes de recherche d'un article dans les listes de l'index (terme → ensemble de slugs)"""
+    for term in terms:
+        postings.setdefault(term, set()).add(slug)
+
+def remove_postings(postings, slugs):
+    """Retire des articles des listes de l'index ; retourne les termes qu'ils y avaient, par slug"""
+    removed = {slug: set() for slug in slugs}
+    for term in list(postings):
+        found = postings[term].intersection(removed)
+        if found:
+            for slug in found:
+                removed[slug].add(term)
+            postings[term] -= found
+            if not postings[term]:
+                del postings[term]
+    return removed
+
+def build_search_index(taxonomy, postings):
+    """Index de recherche inversé : terme → articles, avec table des préfixes de 2 caractères
+    (postings : terme → slugs, voir add_postings)"""
+    # Même ordre que la page d'accueil : les résultats s'affichent du plus récent au plus ancien
+    # Extrait en texte brut, tronqué avant tout échappement : site.js l'échappe à l'affichage
+    docs = [[article.title, f"articles/{article.slug}.html", article.category,
+             format_date(article.date), html_unescape(article.excerpt)[:160]] for article in taxonomy['ordered']]
+    
+    # Termes triés : la table des préfixes donne la plage [début, fin[ de chaque préfixe
+    terms = sorted(postings)
+    prefixes = {}
+    for position, term in enumerate(terms):
+        prefixes.setdefault(term[:2], [position, position])[1] = position + 1
+    
+    # Listes d'articles encodées en écarts (identifiants croissants) pour réduire la taille
+    order = taxonomy['order']
+    encoded = []
+    for term in terms:
+        ids = sorted(order[slug] for slug in postings[term])
+        encoded.append([ids[0]] + [b - a for a, b in zip(ids, ids[1:])])
+    
+    return {'docs': docs, 'terms': terms, 'postings': encoded, 'prefixes': prefixes,
+            'stopwords': sorted(SEARCH_STOPWORDS), 'max_term_length': SEARCH_TERM_MAX_LENGTH}
+
+@functools.lru_cache(maxsize=4096)
 def format_date(date_str):
-    """Formate une date en français"""
+    """Formate une date en français (mémoïsé : appelé pour chaque carte d'article)"""
     try:
         date_obj = datetime.strptime(date_str, '%Y-%m-%d')
         months = {
@@ -98,1540 +660,1760 @@ def format_date(date_str):
     except:
         return date_str
 
-def get_related_articles(article, all_articles, max_related=3):
-    """Trouve les articles liés par catégorie et tags"""
-    related = []
+def add_taxonomy_term(terms, name, article, position):
+    """Ajoute un article (parcourus du plus récent au plus ancien) à une catégorie ou un tag de la taxonomie"""
+    term = terms.get(name)
+    if term is None:
+        term = terms[name] = {'name': name, 'slug': None, 'articles': [], 'positions': [], 'count': 0,
+                              'latest': article.date, 'reading_time': 0}
+    term['articles'].append(article.slug)
+    term['positions'].append(position)
+    term['count'] += 1
+    term['reading_time'] += article.reading_time
+
+def assign_slugs(terms):
+    """Donne à chaque catégorie ou tag un slug unique : quand plusieurs noms donnent le même (« C », « C# » et « C++ »
+    donnent « c », un nom sans lettre ni chiffre ASCII donne « divers »), le premier dans l'ordre alphabétique le garde
+    et les suivants reçoivent un suffixe -2, -3… libre ; les noms qui ne donnent « divers » que par défaut passent après"""
+    by_slug = {}
+    for name in sorted(terms, key=lambda name: (not re.search(r'[a-zA-Z0-9]', unicodedata.normalize('NFKD', name)), name)):
+        by_slug.setdefault(slugify(name), []).append(name)
+    used = set(by_slug)
+    for slug, names in by_slug.items():
+        terms[names[0]]['slug'] = slug
+        suffix = 1
+        for name in names[1:]:
+            suffix += 1
+            while f"{slug}-{suffix}" in used:
+                suffix += 1
+            used.add(f"{slug}-{suffix}")
+            terms[name]['slug'] = f"{slug}-{suffix}"
+        if len(names) > 1:
+            resolved = ', '.join(f"{name} → {terms[name]['slug']}" for name in names)
+            print(f"  ⚠️  Slugs en collision : {resolved}")
+
+def build_taxonomy(articles):
+    """Index des catégories et des tags (slugs, nombre d'articles, date la plus récente, temps de lecture),
+    calculé une fois par build et partagé par les listings, les articles liés, la recherche et les flux"""
+    # Ordre de référence : plus récent d'abord, puis par slug (indépendant de l'ordre du glob)
+    ordered = sorted(articles, key=lambda a: a.slug)
+    ordered.sort(key=lambda a: a.date, reverse=True)
+    
+    taxonomy = {'ordered': ordered, 'articles': {}, 'order': {}, 'categories': {}, 'tags': {}}
+    for position, article in enumerate(ordered):
+        taxonomy['articles'][article.slug] = article
+        taxonomy['order'][article.slug] = position
+        add_taxonomy_term(taxonomy['categories'], article.category, article, position)
+        for tag in dict.fromkeys(article.tags):
+            add_taxonomy_term(taxonomy['tags'], tag, article, position)
+    assign_slugs(taxonomy['categories'])
+    assign_slugs(taxonomy['tags'])
+    return taxonomy
+
+def term_slugs(terms, names):
+    """Slugs (voir assign_slugs) de quelques catégories ou tags, pour leurs liens"""
+    return {name: terms[name]['slug'] for name in names}
+
+def taxonomy_data(taxonomy):
+    """Contenu de taxonomy.json : catégories et tags avec leurs statistiques, leurs articles et leur page"""
+    data = {}
+    for kind, key in (('category', 'categories'), ('tag', 'tags')):
+        data[key] = {name: {**{field: value for field, value in term.items() if field != 'positions'},
+                            'url': listing_path({'kind': kind, 'slug': term['slug']}, 1)}
+                     for name, term in sorted(taxonomy[key].items())}
+    data['total_articles'] = len(taxonomy['ordered'])
+    data['total_reading_time'] = sum(term['reading_time'] for term in taxonomy['categories'].values())
+    return data
+
+def get_related_articles(article, taxonomy, max_related=3):
+    """Trouve les articles liés par catégorie et tags (taxonomy : voir build_taxonomy)"""
+    slug = article.slug
+    order = taxonomy['order']
     
-    for other in all_articles:
-        if other['slug'] == article['slug']:
+    # Score de similarité : 2 points par tag commun, 3 points pour la même catégorie. Les listes des tags et de
+    # la catégorie (positions dans l'ordre de départage) sont parcourues ensemble, curseur par curseur
+    terms = [taxonomy['tags'][tag] for tag in set(article.tags)]
+    terms.append(taxonomy['categories'][article.category])
+    weights = [2] * (len(terms) - 1) + [3]
+    cursors = [[term['positions'][0], i, 0] for i, term in enumerate(terms)]
+    
+    best = []  # (-score, position, slug) des meilleurs candidats, triés
+    while cursors:
+        # Pivot : un article placé avant lui n'apparaît que dans les listes dont le curseur le précède, trop peu
+        # pour battre le dernier retenu (à score égal, il perd le départage) ; on saute directement au pivot
+        threshold = -best[-1][0] if len(best) == max_related else 0
+        cursors.sort()
+        total = 0
+        for pivot, i, _ in cursors:
+            total += weights[i]
+            if total > threshold:
+                break
+        else:
+            break
+        if cursors[0][0] < pivot:
+            for cursor in cursors:
+                if cursor[0] < pivot:
+                    positions = terms[cursor[1]]['positions']
+                    cursor[2] = bisect.bisect_left(positions, pivot, cursor[2])
+                    cursor[0] = positions[cursor[2]] if cursor[2] < len(positions) else None
+            cursors = [cursor for cursor in cursors if cursor[0] is not None]
             continue
         
-        # Score de similarité
+        # Tous les curseurs sont au pivot ou après : ceux qui y sont donnent son score complet
         score = 0
-        if other['category'] == article['category']:
-            score += 3
-        
-        # Tags communs
-        common_tags = set(article['tags']).intersection(set(other['tags']))
-        score += len(common_tags) * 2
+        for cursor in cursors:
+            if cursor[0] != pivot:
+                break
+            positions = terms[cursor[1]]['positions']
+            score += weights[cursor[1]]
+            cursor[2] += 1
+            cursor[0] = positions[cursor[2]] if cursor[2] < len(positions) else None
+        cursors = [cursor for cursor in cursors if cursor[0] is not None]
+        other = taxonomy['ordered'][pivot]
+        if other.slug != slug:
+            bisect.insort(best, (-score, pivot, other.slug))
+            del best[max_related:]
+    return [taxonomy['articles'][other] for _, _, other in best]
+
+def write_if_changed(output_path, data):
+    """Écrit atomiquement (fichier temporaire + os.replace) seulement si le contenu diffère ; retourne True si écrit"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    try:
+        if output_path.stat().st_size == len(data) and output_path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    
+    temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, output_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return True
+
+def copy_prefix(source, destination, size, block=1 << 16):
+    """Recopie les size premiers octets de source (depuis le début) dans destination"""
+    source.seek(0)
+    while size > 0:
+        data = source.read(min(block, size))
+        if not data:
+            break
+        destination.write(data)
+        size -= len(data)
+
+def write_chunks_if_changed(output_path, chunks):
+    """Comme write_if_changed, pour un flux de morceaux (str ou bytes) écrits au fil de l'eau sans assembler la page"""
+    try:
+        current = open(output_path, 'rb')
+    except FileNotFoundError:
+        current = None
+    temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    output = None
+    identical = 0  # Octets identiques au début du fichier existant
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            if output is None:
+                if current is not None and current.read(len(chunk)) == chunk:
+                    identical += len(chunk)
+                    continue
+                # Première différence : le préfixe commun est recopié depuis l'ancien fichier
+                output = open(temp_path, 'wb')
+                if identical:
+                    copy_prefix(current, output, identical)
+            output.write(chunk)
         
-        if score > 0:
-            related.append((score, other))
+        if output is None:
+            if current is not None and not current.read(1):
+                return False
+            # Ancien fichier plus long (ou absent) : seul le préfixe commun est conservé
+            output = open(temp_path, 'wb')
+            if identical:
+                copy_prefix(current, output, identical)
+        output.close()
+        if current is not None:
+            current.close()
+        os.replace(temp_path, output_path)
+        return True
+    finally:
+        if output is not None:
+            output.close()
+        if current is not None:
+            current.close()
+        temp_path.unlink(missing_ok=True)
+
+def publish_asset(data, name, writes, directory=ASSETS_OUTPUT):
+    """Écrit un fichier statique sous un nom empreinté (cache immuable) et retourne son chemin relatif à _site/"""
+    directory.mkdir(parents=True, exist_ok=True)
+    stem, suffix = name.rsplit('.', 1)
+    fingerprinted = f"{stem}.{hash_bytes(data)[:12]}.{suffix}"
+    writes[write_if_changed(directory / fingerprinted, data)] += 1
+    # Supprimer les versions précédentes
+    for old in directory.glob(f"{stem}.*.{suffix}"):
+        if old.name != fingerprinted:
+            old.unlink()
+    return (directory / fingerprinted).relative_to(OUTPUT_DIR).as_posix()
+
+def pygments_theme_css():
+    """Règles de coloration des blocs .codehilite pour chaque thème (vide sans Pygments)"""
+    try:
+        from pygments.formatters import HtmlFormatter
+    except ImportError:
+        return ''
+    rules = ["\n/* Coloration syntaxique générée par Pygments (PYGMENTS_STYLES dans generate.py) */"]
+    for theme, style in PYGMENTS_STYLES.items():
+        rules.extend(HtmlFormatter(style=style).get_token_style_defs(f':root[data-theme="{theme}"] .codehilite'))
+    return '\n'.join(rules) + '\n'
+
+def build_assets(writes):
+    """Publie les CSS/JS partagés sous un nom empreinté et retourne leurs chemins relatifs à _site/ (writes : compteur d'écritures)"""
+    assets = {}
+    for kind, name in SITE_ASSETS.items():
+        data = (ASSETS_DIR / name).read_bytes()
+        if kind == 'css':
+            data += pygments_theme_css().encode('utf-8')
+        assets[kind] = publish_asset(data, name, writes)
+    return assets
+
+def subset_font(data, charset):
+    """Réduit une police aux caractères de charset (WOFF2) si fontTools et brotli sont installés ; sinon la police entière"""
+    if font_subset is None or brotli is None or charset is None:
+        return data
+    key = hash_bytes(data + fonttools_version.encode('utf-8') + ''.join(sorted(charset)).encode('utf-8'))
+    cache_path = FONT_CACHE_DIR / f"{key}.woff2"
+    try:
+        return cache_path.read_bytes()
+    except OSError:
+        pass
     
-    # Trier par score et retourner les meilleurs
-    related.sort(reverse=True, key=lambda x: x[0])
-    return [r[1] for r in related[:max_related]]
-
-def generate_article_page(article, all_articles):
-    """Génère une page HTML pour un article"""
+    options = font_subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    font = font_subset.load_font(io.BytesIO(data), options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(unicodes=[ord(c) for c in charset])
+    subsetter.subset(font)
+    output = io.BytesIO()
+    font_subset.save_font(font, output, options)
+    subset = output.getvalue()
+    FONT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_if_changed(cache_path, subset)
+    return subset
+
+def font_charset(sources):
+    """Caractères utilisés par le corpus (sources : (chemin, empreinte, clé de changement)) en plus du socle,
+    ceux de chaque source en cache selon son empreinte"""
+    try:
+        cached = json.loads(CHARSET_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cached = {}
+    chars = {}
+    for filepath, source_hash, _ in sources:
+        if source_hash not in chars:
+            chars[source_hash] = cached[source_hash] if source_hash in cached else \
+                ''.join(sorted(set(filepath.read_text(encoding='utf-8'))))
+    CHARSET_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(CHARSET_CACHE_PATH, json.dumps(chars, ensure_ascii=False, separators=(',', ':'), sort_keys=True))
     
-    # Articles liés
-    related_articles = get_related_articles(article, all_articles)
-    related_html = ''
+    charset = set(FONT_BASE_CHARSET)
+    for source_chars in chars.values():
+        charset.update(source_chars)
+    return charset
+
+def build_vendor_assets(writes, sources=()):
+    """Publie les polices de _vendor/fonts/ (réduites aux caractères des sources si possible) ;
+    aucune s'il en manque une"""
+    missing = [name for _, _, name, _, _ in VENDOR_FONTS if not (VENDOR_DIR / "fonts" / name).exists()]
+    fonts = []
+    if not missing:
+        # Caractères collectés seulement si les polices seront réellement réduites
+        charset = font_charset(sources) if font_subset is not None and brotli is not None else None
+        for family, weight, name, preload, _ in VENDOR_FONTS:
+            data = subset_font((VENDOR_DIR / "fonts" / name).read_bytes(), charset)
+            fonts.append({'family': family, 'weight': weight, 'preload': preload,
+                          'path': publish_asset(data, name, writes, FONTS_OUTPUT)})
+    # Polices retirées de _vendor/
+    published = {font['path'] for font in fonts}
+    for old in FONTS_OUTPUT.glob('*.woff2'):
+        if old.relative_to(OUTPUT_DIR).as_posix() not in published:
+            old.unlink()
     
-    if related_articles:
-        related_cards = ''
-        for related in related_articles:
-            related_cards += f'''
-            <a href="{related['slug']}.html" class="related-card">
-                <div class="related-category">{related['category']}</div>
-                <h4>{related['title']}</h4>
-                <p>{related['excerpt'][:100]}...</p>
-            </a>
-            '''
+    if missing:
+        print(f"  ⚠️  {len(missing)} police(s) absente(s) de {VENDOR_DIR.name}/fonts/ (python generate.py fetch-fonts) : "
+              f"polices chargées depuis Google Fonts")
+    return {'fonts': fonts}
+
+def vendor_font_downloads():
+    """Fichiers de _vendor/fonts/ à télécharger : (nom, URL source, famille attendue ou None pour une licence)"""
+    downloads = [(name, url, family) for family, _, name, _, url in VENDOR_FONTS]
+    return downloads + [(name, url, None) for name, url in VENDOR_FONT_LICENSES.items()]
+
+def vendor_fonts_key():
+    """Empreinte des sources des polices (clé du cache de _vendor/fonts/ en CI)"""
+    return hash_json(vendor_font_downloads())[:16]
+
+def fetch_vendor_fonts():
+    """Télécharge dans _vendor/fonts/ les polices absentes ou dont la source a changé (converties en WOFF2)
+    et leurs licences ; retourne le nombre d'échecs"""
+    if font_subset is None or brotli is None:
+        print("  ❌ fontTools et brotli sont nécessaires pour vérifier et convertir les polices")
+        return len(VENDOR_FONTS)
+    from fontTools.ttLib import TTFont
+    
+    directory = VENDOR_DIR / "fonts"
+    directory.mkdir(parents=True, exist_ok=True)
+    # URL d'origine de chaque fichier déjà téléchargé : un fichier dont la source a changé est retéléchargé
+    sources_path = directory / "sources.json"
+    try:
+        sources = json.loads(sources_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        sources = {}
+    failures = 0
+    for name, url, family in vendor_font_downloads():
+        path = directory / name
+        if path.exists() and sources.get(name) == url:
+            continue
+        try:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                data = response.read()
+            if family is not None:
+                # Police valide de la famille attendue, réécrite en WOFF2 (les sources Poppins sont en TTF)
+                font = TTFont(io.BytesIO(data))
+                if font['name'].getBestFamilyName() != family:
+                    raise ValueError(f"famille {font['name'].getBestFamilyName()!r} au lieu de {family!r}")
+                font.flavor = 'woff2'
+                output = io.BytesIO()
+                font.save(output)
+                data = output.getvalue()
+        except Exception as e:
+            failures += 1
+            print(f"  ❌ {name} : {url} ({e})")
+            continue
+        write_if_changed(path, data)
+        sources[name] = url
+        print(f"  📥 {name}")
+    write_if_changed(sources_path, json.dumps(sources, indent=1, sort_keys=True))
+    return failures
+
+def font_head_html(assets, root):
+    """Balises <head> des polices auto-hébergées : préchargement et @font-face avec font-display: swap
+    (feuille de style Google Fonts si elles ne sont pas toutes dans _vendor/fonts/)"""
+    if not assets['fonts']:
+        return GOOGLE_FONTS_HTML
+    preloads = ''.join(f'<link rel="preload" href="{root}{font["path"]}" as="font" type="font/woff2" crossorigin>\n    '
+                       for font in assets['fonts'] if font['preload'])
+    faces = '\n'.join(f"        @font-face {{ font-family: '{font['family']}'; font-weight: {font['weight']}; "
+                      f"font-display: swap; src: url({root}{font['path']}) format('woff2'); }}"
+                      for font in assets['fonts'])
+    return f"{preloads}<style>\n{faces}\n    </style>"
+
+def local_image_sources(html_content):
+    """src des images locales d'un document HTML (ni URL absolue, ni data:), sans doublons"""
+    sources = []
+    for match in IMAGE_TAG.finditer(html_content):
+        src = IMAGE_SRC.search(match.group(1))
+        if src:
+            src = html_unescape(src.group(1))
+            if src and not urlsplit(src).scheme and not src.startswith(('/', '#')) and src not in sources:
+                sources.append(src)
+    return sources
+
+def image_formats():
+    """Formats des variantes que Pillow sait écrire (AVIF d'abord : le navigateur prend la première source reconnue)"""
+    if Image is None:
+        return []
+    return [fmt for fmt in IMAGE_QUALITY if pillow_features.check(fmt)]
+
+def convert_image(data, prefix):
+    """Dimensions et variantes redimensionnées d'une image (Pillow) ; retourne (description, {chemin: octets})"""
+    info = {'width': None, 'height': None, 'variants': {}}
+    files = {}
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            animated = getattr(image, 'is_animated', False)
+            image = ImageOps.exif_transpose(image)
+            info['width'], info['height'] = image.size
+            if animated:
+                return info, files  # Les GIF animés restent tels quels
+            transparent = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if transparent else 'RGB')
+            widths = [width for width in IMAGE_WIDTHS if width < image.width] + [image.width]
+            for fmt in image_formats():
+                variants = []
+                for width in widths:
+                    resized = image
+                    if width < image.width:
+                        resized = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+                    output = io.BytesIO()
+                    resized.save(output, fmt.upper(), quality=IMAGE_QUALITY[fmt])
+                    if output.tell() >= len(data):
+                        continue  # Plus lourde que l'original (capture déjà bien compressée) : inutile
+                    path = f"{prefix}-{width}.{fmt}"
+                    files[path] = output.getvalue()
+                    variants.append([width, path])
+                if variants:
+                    info['variants'][fmt] = variants
+    except (OSError, ValueError, Image.DecompressionBombError):
+        pass  # Format inconnu de Pillow (SVG...) ou image illisible : copiée sans variantes
+    return info, files
+
+def process_image(task):
+    """Publie une image dans _site/images/ (original sous un nom empreinté, variantes en cache par empreinte) ;
+    task : (chemin, empreinte connue ou None). Retourne sa description (chemins relatifs à _site/, dimensions,
+    variantes par format), le nombre de fichiers écrits et son empreinte"""
+    source_path, digest = task
+    with profile_stage('images', source_path.name):
+        # Fichier inchangé : lu seulement s'il faut le convertir ou le publier
+        data = None
+        if digest is None:
+            data = source_path.read_bytes()
+            digest = hash_bytes(data)
+        prefix = f"{IMAGES_OUTPUT.relative_to(OUTPUT_DIR).as_posix()}/{slugify(source_path.stem)}.{digest[:12]}"
         
-        related_html = f'''
-        <section class="related-articles">
-            <h3>📚 Articles liés</h3>
-            <div class="related-grid">
-                {related_cards}
-            </div>
-        </section>
-        '''
+        # Cache indexé par le contenu et les réglages : une image inchangée n'est jamais reconvertie
+        key = hash_json([prefix, digest, image_formats(), IMAGE_WIDTHS, IMAGE_QUALITY, pillow_version])
+        info_path = IMAGE_CACHE_DIR / f"{key}.json"
+        try:
+            info = json.loads(info_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            info = None
+        if info is None or any(not (IMAGE_CACHE_DIR / Path(path).name).exists()
+                               for variants in info['variants'].values() for _, path in variants):
+            if data is None:
+                data = source_path.read_bytes()
+            info, files = convert_image(data, prefix) if Image is not None else ({'width': None, 'height': None, 'variants': {}}, {})
+            IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            for path, variant in files.items():
+                write_if_changed(IMAGE_CACHE_DIR / Path(path).name, variant)
+            write_if_changed(info_path, json.dumps(info))
+        info['path'] = f"{prefix}{source_path.suffix.lower()}"
+        
+        # Noms empreintés : un fichier déjà publié est forcément à jour
+        written = 0
+        IMAGES_OUTPUT.mkdir(parents=True, exist_ok=True)
+        for path in image_paths(info):
+            output_path = OUTPUT_DIR / path
+            if not output_path.exists():
+                if path != info['path']:
+                    write_if_changed(output_path, (IMAGE_CACHE_DIR / output_path.name).read_bytes())
+                else:
+                    write_if_changed(output_path, source_path.read_bytes() if data is None else data)
+                written += 1
+    return info, written, digest
+
+def image_paths(info):
+    """Fichiers publiés d'une image : original puis variantes"""
+    return [info['path']] + [path for variants in info['variants'].values() for _, path in variants]
+
+def build_images(articles, writes, pool=None, jobs=1):
+    """Publie les images référencées par les articles et supprime les anciennes ; retourne {src: description}"""
+    sources = {}
+    for article in articles:
+        for src in article.images:
+            path = ARTICLES_DIR / unquote(urlsplit(src).path)
+            if path.is_file():
+                sources.setdefault(path, []).append(src)
+            else:
+                print(f"  ⚠️  Image introuvable dans {article.filepath.name} : {src}")
+    
+    # Empreintes du build précédent, valables tant que la clé de changement du fichier est la même
+    try:
+        previous = json.loads(IMAGE_DIGESTS_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        previous = {}
+    stats = {path: source_stat(path) for path in sources}
+    tasks = []
+    for path in sources:
+        entry = previous.get(path.as_posix())
+        tasks.append((path, entry[2] if entry and entry[:2] == stats[path] else None))
+    
+    images = {}
+    published = set()
+    digests = {}
+    for (path, srcs), (info, written, digest) in zip(sources.items(), map_tasks(pool, process_image, tasks, jobs)):
+        digests[path.as_posix()] = stats[path] + [digest]
+        images.update(dict.fromkeys(srcs, info))
+        published.update(image_paths(info))
+        writes[True] += written
+        writes[False] += len(image_paths(info)) - written
+    
+    # Images qui ne sont plus référencées
+    if IMAGES_OUTPUT.exists():
+        for old in IMAGES_OUTPUT.iterdir():
+            if old.relative_to(OUTPUT_DIR).as_posix() not in published:
+                old.unlink()
+    IMAGE_DIGESTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(IMAGE_DIGESTS_PATH, json.dumps(digests, ensure_ascii=False, separators=(',', ':'), sort_keys=True))
+    return images
+
+def rewrite_images(html_content, images, root):
+    """Remplace les <img> locales par leur version publiée : dimensions, chargement différé et <picture> (srcset)"""
+    def replace(match):
+        attributes = match.group(1)
+        src = IMAGE_SRC.search(attributes)
+        info = images.get(html_unescape(src.group(1))) if src else None
+        if info is None:
+            return match.group(0)
+        attributes = attributes[:src.start()] + f' src="{root}{info["path"]}"' + attributes[src.end():]
+        if info['width'] and ' width=' not in attributes:
+            attributes += f' width="{info["width"]}" height="{info["height"]}"'
+        if ' loading=' not in attributes:
+            attributes += ' loading="lazy"'
+        if ' decoding=' not in attributes:
+            attributes += ' decoding="async"'
+        img = f'<img{attributes} />'
+        if not info['variants']:
+            return img
+        sources = ''.join(f'<source type="image/{fmt}" srcset="{", ".join(f"{root}{path} {width}w" for width, path in variants)}" '
+                          f'sizes="{IMAGE_SIZES}">' for fmt, variants in info['variants'].items())
+        return f'<picture>{sources}{img}</picture>'
+    
+    return IMAGE_TAG.sub(replace, html_content)
+
+def encode_value(value):
+    """Valeur d'un emplacement {{ expression }}, encodée en UTF-8"""
+    if type(value) is str:
+        return value.encode('utf-8')
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode('utf-8')
+
+def encode_stream(chunks):
+    """Morceaux d'un emplacement {{ *flux }}, encodés en UTF-8 (une chaîne seule compte pour un morceau) ;
+    un générateur, comme le rendu d'un autre gabarit, doit produire des bytes et est repris tel quel"""
+    if isinstance(chunks, GeneratorType):
+        return chunks
+    if isinstance(chunks, (str, bytes)):
+        return (encode_value(chunks),)
+    return [encode_value(chunk) for chunk in chunks]
+
+# Noms disponibles dans les gabarits sans passer par le contexte
+TEMPLATE_GLOBALS = {
+    '_encode': encode_value,
+    '_stream': encode_stream,
+    '_builtins': builtins,
+    'format_date': format_date,
+    'truncate_excerpt': truncate_excerpt,
+    'FEED_ATOM_PATH': FEED_ATOM_PATH,
+    'FEED_JSON_PATH': FEED_JSON_PATH,
+}
+
+def compile_template(name, source):
+    """Compile un gabarit en fonction génératrice render(contexte) : morceaux statiques pré-encodés et emplacements"""
+    body = []
+    run = []  # Morceaux statiques et valeurs consécutifs, émis en un seul morceau
+    loaded, stored = set(), set()
+    
+    def flush():
+        if len(run) == 1 and run[0].startswith("b"):
+            body.append(f"    yield {run[0]}")
+        elif run:
+            body.append(f"    yield b''.join(({', '.join(run)},))")
+        run.clear()
+    
+    position = 0
+    for match in TEMPLATE_SLOT.finditer(source):
+        if match.start() > position:
+            run.append(repr(source[position:match.start()].encode('utf-8')))
+        stream, expression = match.groups()
+        try:
+            tree = ast.parse(expression, mode='eval')
+        except SyntaxError as e:
+            line = source.count('\n', 0, match.start()) + 1
+            raise SyntaxError(f"{name}, ligne {line} : emplacement invalide {{{{ {expression} }}}} ({e.msg})") from None
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                (loaded if isinstance(node.ctx, ast.Load) else stored).add(node.id)
+        if stream:
+            # Les flux (contenu converti, cartes, sections) ne sont jamais recopiés dans un morceau assemblé
+            flush()
+            body.append(f"    yield from _stream({expression})")
+        else:
+            run.append(f"_encode({expression})")
+        position = match.end()
+    if position < len(source):
+        run.append(repr(source[position:].encode('utf-8')))
+    flush()
+    
+    # Les noms libres des expressions sont lus une seule fois dans le contexte, en variables locales ;
+    # un nom de fonction native (id, type, next…) n'est pris dans builtins qu'en l'absence de valeur du contexte
+    names = sorted(loaded - stored - TEMPLATE_GLOBALS.keys())
+    header = ["def render(_ctx):"] + [f"    {n} = _ctx.get({n!r}, _builtins.{n})" if hasattr(builtins, n)
+                                      else f"    {n} = _ctx[{n!r}]" for n in names]
+    return compile('\n'.join(header + body + ["    return", "    yield"]) + '\n', f"<gabarit {name}>", 'exec')
+
+@functools.lru_cache(maxsize=None)
+def load_template(name):
+    """Fonction de rendu d'un gabarit de TEMPLATES_DIR, depuis le cache de code compilé si possible"""
+    source = (TEMPLATES_DIR / name).read_text(encoding='utf-8')
+    if source.endswith('\n'):
+        source = source[:-1]  # Comme Jinja : le saut de ligne final du fichier n'est pas rendu
+    
+    # Le code compilé (marshal) dépend du gabarit, du moteur et de la version de Python
+    key = hashlib.sha256(importlib.util.MAGIC_NUMBER + TEMPLATE_ENGINE_VERSION.encode('utf-8')
+                         + source.encode('utf-8')).hexdigest()[:16]
+    stem = Path(name).stem
+    cache_path = TEMPLATE_CACHE_DIR / f"{stem}.{key}.marshal"
+    try:
+        code = marshal.loads(cache_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        code = compile_template(name, source)
+        TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_if_changed(cache_path, marshal.dumps(code))
+        for stale in TEMPLATE_CACHE_DIR.glob(f"{stem}.*.marshal"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    
+    namespace = dict(TEMPLATE_GLOBALS)
+    exec(code, namespace)
+    return namespace['render']
+
+def render_template(name, **context):
+    """Rendu d'un gabarit, morceau par morceau (bytes UTF-8)"""
+    return load_template(name)(context)
+
+def generate_article_page(article, related_articles, assets, images=None, tag_slugs=None):
+    """Génère une page HTML (bytes UTF-8) pour un article (related_articles : voir get_related_articles)"""
+    return b''.join(iter_article_page(article, related_articles, assets, images, tag_slugs))
+
+def iter_article_page(article, related_articles, assets, images=None, tag_slugs=None):
+    """Page HTML d'un article, morceau par morceau (le contenu converti n'est recopié que s'il a des images ;
+    tag_slugs : slugs des tags de l'article dans la taxonomie, voir assign_slugs)"""
+    content = article.content
+    if images:
+        content = rewrite_images(content, images, '../')
     
     # Tags HTML
     tags_html = ''
-    if article['tags']:
-        tags_items = ''.join([f'<span class="article-tag">#{tag}</span>' for tag in article['tags']])
+    if article.tags:
+        tag_slugs = tag_slugs or {tag: slugify(tag) for tag in article.tags}
+        tags_items = ''.join([f'<a href="../tag/{tag_slugs[tag]}.html" class="article-tag">#{tag}</a>' for tag in article.tags])
         tags_html = f'<div class="article-tags">{tags_items}</div>'
     
-    html = f'''<!DOCTYPE html>
-<html lang="fr" data-theme="dark">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{article['title']} - CyberInsight</title>
-    <meta name="description" content="{article['excerpt'][:150]}">
-    <meta property="og:title" content="{article['title']}">
-    <meta property="og:description" content="{article['excerpt'][:150]}">
-    <meta property="og:type" content="article">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600;700&family=Poppins:wght@300;400;600;700&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/tokyo-night-dark.min.css">
-    <style>
-        :root[data-theme="dark"] {{
-            --color-bg: #0a0e17;
-            --color-surface: #151922;
-            --color-surface-elevated: #1e232e;
-            --color-primary: #00f5a0;
-            --color-secondary: #00d9ff;
-            --color-accent: #ff006e;
-            --color-text: #e8ecf3;
-            --color-text-muted: #8b92a8;
-            --color-border: #2a3142;
-        }}
-
-        :root[data-theme="light"] {{
-            --color-bg: #ffffff;
-            --color-surface: #f8f9fa;
-            --color-surface-elevated: #ffffff;
-            --color-primary: #00a870;
-            --color-secondary: #0088cc;
-            --color-accent: #e91e63;
-            --color-text: #1a1a1a;
-            --color-text-muted: #6c757d;
-            --color-border: #dee2e6;
-        }}
-
-        :root {{
-            --font-display: 'JetBrains Mono', monospace;
-            --font-body: 'Poppins', sans-serif;
-        }}
-
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-
-        body {{
-            font-family: var(--font-body);
-            background: var(--color-bg);
-            color: var(--color-text);
-            line-height: 1.8;
-            transition: background 0.3s ease, color 0.3s ease;
-        }}
-
-        body::before {{
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: 
-                radial-gradient(circle at 20% 50%, rgba(0, 245, 160, 0.05) 0%, transparent 50%),
-                radial-gradient(circle at 80% 80%, rgba(0, 217, 255, 0.05) 0%, transparent 50%);
-            pointer-events: none;
-            z-index: 0;
-            opacity: 0.5;
-            transition: opacity 0.3s ease;
-        }}
-
-        [data-theme="light"] body::before {{
-            opacity: 0.3;
-        }}
-
-        .container {{
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            position: relative;
-            z-index: 1;
-        }}
-
-        header {{
-            padding: 2rem 0;
-            border-bottom: 1px solid var(--color-border);
-            backdrop-filter: blur(10px);
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            background: var(--color-bg);
-            transition: all 0.3s ease;
-        }}
-
-        .header-content {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-
-        .logo {{
-            font-family: var(--font-display);
-            font-size: 1.5rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, var(--color-primary), var(--color-secondary));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            text-decoration: none;
-        }}
-
-        .header-actions {{
-            display: flex;
-            gap: 1.5rem;
-            align-items: center;
-        }}
-
-        .back-link {{
-            color: var(--color-text-muted);
-            text-decoration: none;
-            font-size: 0.95rem;
-            transition: color 0.3s ease;
-        }}
-
-        .back-link:hover {{ color: var(--color-primary); }}
-
-        /* Theme Toggle */
-        .theme-toggle {{
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            border-radius: 50px;
-            padding: 0.5rem;
-            cursor: pointer;
-            font-size: 1.2rem;
-            transition: all 0.3s ease;
-            width: 40px;
-            height: 40px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-
-        .theme-toggle:hover {{
-            border-color: var(--color-primary);
-            transform: rotate(180deg);
-        }}
-
-        article {{ padding: 4rem 0; }}
-
-        .article-header {{ margin-bottom: 3rem; }}
-
-        .article-meta {{
-            display: flex;
-            gap: 1.5rem;
-            align-items: center;
-            margin-bottom: 1.5rem;
-            font-size: 0.9rem;
-            color: var(--color-text-muted);
-            font-family: var(--font-display);
-            flex-wrap: wrap;
-        }}
-
-        .category-badge {{
-            background: var(--color-primary);
-            color: var(--color-bg);
-            padding: 0.3rem 0.8rem;
-            border-radius: 4px;
-            font-weight: 700;
-            text-transform: uppercase;
-            font-size: 0.75rem;
-            letter-spacing: 0.05em;
-        }}
-
-        .reading-time {{
-            display: flex;
-            align-items: center;
-            gap: 0.3rem;
-        }}
-
-        .article-title {{
-            font-size: 2.8rem;
-            line-height: 1.2;
-            margin-bottom: 1rem;
-            font-weight: 700;
-        }}
-
-        .article-tags {{
-            display: flex;
-            gap: 0.5rem;
-            flex-wrap: wrap;
-            margin-top: 1rem;
-        }}
-
-        .article-tag {{
-            background: var(--color-surface-elevated);
-            color: var(--color-primary);
-            padding: 0.3rem 0.8rem;
-            border-radius: 4px;
-            font-size: 0.85rem;
-            font-family: var(--font-display);
-            border: 1px solid var(--color-border);
-        }}
-
-        .article-content {{
-            font-size: 1.1rem;
-            line-height: 1.9;
-        }}
-
-        .article-content h1,
-        .article-content h2,
-        .article-content h3 {{
-            color: var(--color-text);
-            margin-top: 2.5rem;
-            margin-bottom: 1rem;
-            font-family: var(--font-display);
-        }}
-
-        .article-content h1 {{ font-size: 2.5rem; }}
-        .article-content h2 {{
-            font-size: 2rem;
-            color: var(--color-primary);
-        }}
-        .article-content h3 {{ font-size: 1.5rem; }}
-
-        .article-content p {{ margin-bottom: 1.5rem; }}
-
-        .article-content ul,
-        .article-content ol {{
-            margin-left: 2rem;
-            margin-bottom: 1.5rem;
-        }}
-
-        .article-content li {{ margin-bottom: 0.5rem; }}
-
-        .article-content code {{
-            font-family: var(--font-display);
-            background: var(--color-surface);
-            padding: 0.2rem 0.5rem;
-            border-radius: 4px;
-            color: var(--color-secondary);
-            font-size: 0.9em;
-        }}
-
-        .article-content pre {{
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            border-radius: 8px;
-            padding: 1.5rem;
-            overflow-x: auto;
-            margin-bottom: 1.5rem;
-        }}
-
-        .article-content pre code {{
-            background: none;
-            padding: 0;
-            color: var(--color-text);
-        }}
-
-        .article-content table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 2rem 0;
-            background: var(--color-surface);
-            border-radius: 8px;
-            overflow: hidden;
-        }}
-
-        .article-content th,
-        .article-content td {{
-            padding: 1rem;
-            text-align: left;
-            border-bottom: 1px solid var(--color-border);
-        }}
-
-        .article-content th {{
-            background: var(--color-surface-elevated);
-            color: var(--color-primary);
-            font-family: var(--font-display);
-            font-weight: 700;
-        }}
-
-        .article-content blockquote {{
-            border-left: 4px solid var(--color-primary);
-            padding-left: 1.5rem;
-            margin: 2rem 0;
-            color: var(--color-text-muted);
-            font-style: italic;
-        }}
-
-        .article-content a {{
-            color: var(--color-secondary);
-            text-decoration: none;
-            border-bottom: 1px solid transparent;
-            transition: border-color 0.3s ease;
-        }}
-
-        .article-content a:hover {{
-            border-bottom-color: var(--color-secondary);
-        }}
-
-        .article-content hr {{
-            border: none;
-            border-top: 1px solid var(--color-border);
-            margin: 3rem 0;
-        }}
-
-        /* Share Buttons */
-        .share-section {{
-            margin: 3rem 0;
-            padding: 2rem;
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            border-radius: 12px;
-            text-align: center;
-        }}
-
-        .share-section h4 {{
-            margin-bottom: 1rem;
-            font-family: var(--font-display);
-        }}
-
-        .share-buttons {{
-            display: flex;
-            gap: 1rem;
-            justify-content: center;
-            flex-wrap: wrap;
-        }}
-
-        .share-btn {{
-            padding: 0.7rem 1.5rem;
-            background: var(--color-surface-elevated);
-            border: 1px solid var(--color-border);
-            border-radius: 6px;
-            color: var(--color-text);
-            text-decoration: none;
-            font-size: 0.9rem;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }}
-
-        .share-btn:hover {{
-            border-color: var(--color-primary);
-            transform: translateY(-2px);
-        }}
-
-        /* Related Articles */
-        .related-articles {{
-            margin: 4rem 0;
-            padding-top: 3rem;
-            border-top: 1px solid var(--color-border);
-        }}
-
-        .related-articles h3 {{
-            font-family: var(--font-display);
-            font-size: 1.8rem;
-            margin-bottom: 2rem;
-        }}
-
-        .related-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
-            gap: 1.5rem;
-        }}
-
-        .related-card {{
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            border-radius: 8px;
-            padding: 1.5rem;
-            text-decoration: none;
-            transition: all 0.3s ease;
-            display: block;
-        }}
-
-        .related-card:hover {{
-            border-color: var(--color-primary);
-            transform: translateY(-4px);
-        }}
-
-        .related-category {{
-            color: var(--color-primary);
-            font-size: 0.8rem;
-            font-family: var(--font-display);
-            text-transform: uppercase;
-            margin-bottom: 0.5rem;
-        }}
-
-        .related-card h4 {{
-            color: var(--color-text);
-            margin-bottom: 0.5rem;
-            font-size: 1.1rem;
-        }}
-
-        .related-card p {{
-            color: var(--color-text-muted);
-            font-size: 0.9rem;
-            line-height: 1.5;
-        }}
-
-        /* Back to Top Button */
-        .back-to-top {{
-            position: fixed;
-            bottom: 2rem;
-            right: 2rem;
-            width: 50px;
-            height: 50px;
-            background: var(--color-primary);
-            color: var(--color-bg);
-            border: none;
-            border-radius: 50%;
-            font-size: 1.5rem;
-            cursor: pointer;
-            opacity: 0;
-            pointer-events: none;
-            transition: all 0.3s ease;
-            z-index: 1000;
-            box-shadow: 0 4px 12px rgba(0, 245, 160, 0.3);
-        }}
-
-        .back-to-top.visible {{
-            opacity: 1;
-            pointer-events: all;
-        }}
-
-        .back-to-top:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 20px rgba(0, 245, 160, 0.4);
-        }}
-
-        footer {{
-            border-top: 1px solid var(--color-border);
-            padding: 2rem 0;
-            margin-top: 4rem;
-            text-align: center;
-            color: var(--color-text-muted);
-        }}
-
-        @media (max-width: 768px) {{
-            .article-title {{ font-size: 2rem; }}
-            .article-content {{ font-size: 1rem; }}
-            .related-grid {{ grid-template-columns: 1fr; }}
-            .back-to-top {{
-                bottom: 1rem;
-                right: 1rem;
-                width: 45px;
-                height: 45px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <header>
-        <div class="container">
-            <div class="header-content">
-                <a href="../index.html" class="logo">CyberInsight</a>
-                <div class="header-actions">
-                    <a href="../index.html" class="back-link">← Retour</a>
-                    <button class="theme-toggle" id="themeToggle" aria-label="Toggle theme">
-                        <span id="themeIcon">🌙</span>
-                    </button>
-                </div>
-            </div>
-        </div>
-    </header>
-
-    <main>
-        <div class="container">
-            <article>
-                <div class="article-header">
-                    <div class="article-meta">
-                        <span class="category-badge">{article['category']}</span>
-                        <span>{format_date(article['date'])}</span>
-                        <span>•</span>
-                        <span>{article['author']}</span>
-                        <span>•</span>
-                        <span class="reading-time">⏱️ {article['reading_time']} min</span>
-                    </div>
-                    <h1 class="article-title">{article['title']}</h1>
-                    {tags_html}
-                </div>
-                
-                <div class="article-content">
-                    {article['content']}
-                </div>
-
-                <div class="share-section">
-                    <h4>📤 Partager cet article</h4>
-                    <div class="share-buttons">
-                        <a href="https://twitter.com/intent/tweet?text={article['title']}&url=https://voidsponge.github.io/articles/{article['slug']}.html" 
-                           target="_blank" 
-                           class="share-btn">
-                            𝕏 Twitter
-                        </a>
-                        <a href="https://www.linkedin.com/sharing/share-offsite/?url=https://voidsponge.github.io/articles/{article['slug']}.html" 
-                           target="_blank" 
-                           class="share-btn">
-                            in LinkedIn
-                        </a>
-                        <button onclick="copyLink()" class="share-btn">
-                            🔗 Copier le lien
-                        </button>
-                    </div>
-                </div>
-
-                {related_html}
-            </article>
-        </div>
-    </main>
-
-    <button class="back-to-top" id="backToTop" aria-label="Retour en haut">↑</button>
-
-    <footer>
-        <div class="container">
-            <p>&copy; 2025 CyberInsight. Tous droits réservés.</p>
-        </div>
-    </footer>
-
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
-    <script>
-        hljs.highlightAll();
-
-        // Theme Toggle
-        const themeToggle = document.getElementById('themeToggle');
-        const themeIcon = document.getElementById('themeIcon');
-        const html = document.documentElement;
-
-        // Load saved theme
-        const savedTheme = localStorage.getItem('theme') || 'dark';
-        html.setAttribute('data-theme', savedTheme);
-        updateThemeIcon(savedTheme);
-
-        themeToggle.addEventListener('click', () => {{
-            const currentTheme = html.getAttribute('data-theme');
-            const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
-            html.setAttribute('data-theme', newTheme);
-            localStorage.setItem('theme', newTheme);
-            updateThemeIcon(newTheme);
-        }});
-
-        function updateThemeIcon(theme) {{
-            themeIcon.textContent = theme === 'dark' ? '🌙' : '☀️';
-        }}
-
-        // Back to Top
-        const backToTop = document.getElementById('backToTop');
-
-        window.addEventListener('scroll', () => {{
-            if (window.pageYOffset > 300) {{
-                backToTop.classList.add('visible');
-            }} else {{
-                backToTop.classList.remove('visible');
-            }}
-        }});
-
-        backToTop.addEventListener('click', () => {{
-            window.scrollTo({{
-                top: 0,
-                behavior: 'smooth'
-            }});
-        }});
-
-        // Copy Link
-        function copyLink() {{
-            navigator.clipboard.writeText(window.location.href);
-            alert('✅ Lien copié dans le presse-papiers !');
-        }}
-    </script>
-</body>
-</html>'''
-    
-    return html
-
-def generate_index_page(articles):
-    """Génère la page d'accueil avec toutes les améliorations"""
-    
-    # Trier par date (plus récent en premier)
-    articles_sorted = sorted(articles, key=lambda x: x['date'], reverse=True)
-    
-    # Article en vedette (le plus récent)
-    featured = articles_sorted[0] if articles_sorted else None
-    
-    # Extraire les catégories uniques
-    categories = sorted(set(article['category'] for article in articles_sorted))
-    
-    # Générer les boutons de filtre de catégories
-    category_filters = ''
-    for category in categories:
-        category_filters += f'<button class="filter-btn" data-category="{category}">{category}</button>\n                    '
-    
-    # Générer les cartes d'articles avec temps de lecture
-    articles_html = ''
-    for article in articles_sorted:
+    # Articles liés
+    related = ()
+    if related_articles:
+        cards = (chunk for card in related_articles for chunk in render_template('related_card.html', related=card))
+        related = render_template('related.html', cards=cards)
+    
+    return render_template('article.html', article=article, content=content, assets=assets,
+                           fonts=font_head_html(assets, '../'), tags=tags_html, related=related)
+
+@functools.lru_cache(maxsize=4096)
+def slugify(value):
+    """Transforme un nom de catégorie ou de tag en segment d'URL (mémoïsé : appelé pour chaque lien de tag)"""
+    value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', value.lower()).strip('-') or 'divers'
+
+def listing_path(listing, number):
+    """Chemin (relatif à _site/) de la page number d'un listing (None = accueil)"""
+    if listing is None:
+        return 'index.html' if number == 1 else f"page/{number}.html"
+    base = f"{listing['kind']}/{listing['slug']}"
+    return f"{base}.html" if number == 1 else f"{base}/{number}.html"
+
+def plan_listing_pages(taxonomy, page_size=PAGE_SIZE):
+    """Liste toutes les pages de listing : accueil paginé, puis une liste par catégorie et par tag"""
+    articles_sorted = taxonomy['ordered']
+    categories = sorted(taxonomy['categories'])
+    
+    # Statistiques et article en vedette (le plus récent), sur la page d'accueil uniquement
+    home = {
+        'total_articles': len(articles_sorted),
+        'total_reading_time': sum(term['reading_time'] for term in taxonomy['categories'].values()),
+        'all_categories': len(categories),
+        'featured': articles_sorted[0] if articles_sorted else None,
+    }
+    
+    def listing(kind, terms, name):
+        term = terms[name]
+        return {'kind': kind, 'name': name, 'slug': term['slug']}, [taxonomy['articles'][slug] for slug in term['articles']]
+    
+    category_slugs = term_slugs(taxonomy['categories'], categories)
+    
+    listings = [(None, articles_sorted)]
+    listings += [listing('category', taxonomy['categories'], name) for name in categories]
+    listings += [listing('tag', taxonomy['tags'], name) for name in sorted(taxonomy['tags'])]
+    
+    pages = []
+    for listing, items in listings:
+        chunks = [items[i:i + page_size] for i in range(0, len(items), page_size)] or [[]]
+        for number, chunk in enumerate(chunks, 1):
+            path = listing_path(listing, number)
+            pages.append({
+                'path': path,
+                'root': '../' * path.count('/'),
+                'listing': listing,
+                'number': number,
+                'count': len(chunks),
+                'articles': chunk,
+                'categories': category_slugs,
+                'tag_slugs': term_slugs(taxonomy['tags'], {tag for article in chunk for tag in article.tags[:3]}),
+                'home': home if path == 'index.html' else None,
+            })
+    return pages
+
+def generate_index_page(articles, assets, page_size=PAGE_SIZE):
+    """Génère la page d'accueil (première page du listing paginé)"""
+    return generate_listing_page(plan_listing_pages(build_taxonomy(articles), page_size)[0], assets)
+
+def generate_listing_page(page, assets):
+    """Génère une page de listing (accueil, page suivante, catégorie ou tag ; voir plan_listing_pages) en bytes UTF-8"""
+    return b''.join(iter_listing_page(page, assets))
+
+def iter_article_cards(articles, root, tag_slugs):
+    """Cartes d'articles d'une page de listing, morceau par morceau (tag_slugs : voir plan_listing_pages)"""
+    for article in articles:
         tags_preview = ''
-        if article['tags']:
-            tags_preview = ' '.join([f'#{tag}' for tag in article['tags'][:3]])
+        if article.tags:
+            links = ' '.join([f'<a href="{root}tag/{tag_slugs[tag]}.html">#{tag}</a>' for tag in article.tags[:3]])
+            tags_preview = f'<div class="tags-preview">{links}</div>'
+        yield from render_template('article_card.html', article=article, root=root, tags_preview=tags_preview)
+
+def iter_listing_page(page, assets):
+    """Page de listing morceau par morceau : une carte d'article par gabarit rendu"""
+    root = page['root']
+    listing = page['listing']
+    home = page['home']
+    
+    # Titre de la page
+    if listing is None:
+        heading = 'Articles récents'
+    elif listing['kind'] == 'category':
+        heading = f"Catégorie : {listing['name']}"
+    else:
+        heading = f"Tag : #{listing['name']}"
+    if page['number'] > 1:
+        heading += f" — page {page['number']}"
+    title = 'CyberInsight - Blog de Cybersécurité' if home else f"{heading} - CyberInsight"
+    
+    # Générer les liens de filtre de catégories
+    active = ' active' if listing is None else ''
+    category_filters = f'<a href="{root}index.html" class="filter-btn{active}">Tous</a>\n                    '
+    for category, slug in page['categories'].items():
+        active = ' active' if listing and listing['kind'] == 'category' and listing['name'] == category else ''
+        category_filters += f'<a href="{root}category/{slug}.html" class="filter-btn{active}">{category}</a>\n                    '
+    
+    # Pagination
+    pagination = ()
+    if page['count'] > 1:
+        previous_link = next_link = ''
+        if page['number'] > 1:
+            previous_link = f'<a href="{root}{listing_path(listing, page["number"] - 1)}" class="page-link" rel="prev">← Précédent</a>'
+        if page['number'] < page['count']:
+            next_link = f'<a href="{root}{listing_path(listing, page["number"] + 1)}" class="page-link" rel="next">Suivant →</a>'
+        pagination = render_template('pagination.html', page=page, previous_link=previous_link, next_link=next_link)
+    
+    # Statistiques, présentation et article en vedette : page d'accueil uniquement
+    intro = featured = ()
+    if home:
+        intro = render_template('home.html', home=home)
+        if home['featured']:
+            featured = render_template('featured.html', featured=home['featured'])
+    
+    return render_template('listing.html', title=title, root=root, assets=assets, fonts=font_head_html(assets, root),
+                           intro=intro, category_filters=category_filters, featured=featured, heading=heading,
+                           cards=iter_article_cards(page['articles'], root, page['tag_slugs']), pagination=pagination)
+
+
+def feed_timestamp(date_str):
+    """Date du frontmatter au format RFC 3339 (minuit UTC) ; None si elle n'est pas au format AAAA-MM-JJ"""
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d').strftime('%Y-%m-%dT00:00:00Z')
+    except ValueError:
+        return None
+
+def plan_feed(taxonomy, feed_size=FEED_SIZE):
+    """Entrées des flux : les feed_size articles les plus récents, avec identifiant et date stables"""
+    entries = []
+    for article in taxonomy['ordered'][:feed_size]:
+        updated = feed_timestamp(article.date) or '1970-01-01T00:00:00Z'
+        entries.append({
+            # URI tag : ne change ni avec le titre, ni avec la date, ni avec l'URL du site
+            'id': f"tag:{FEED_TAG_AUTHORITY}:/articles/{article.slug}",
+            'url': f"{SITE_URL}/articles/{article.slug}.html",
+            'updated': updated,
+            'article': article,
+        })
+    return entries
+
+def generate_atom_feed(entries):
+    """Flux Atom (feed.xml) ; la date du flux est celle de l'entrée la plus récente, pas celle du build"""
+    updated = max((entry['updated'] for entry in entries), default='1970-01-01T00:00:00Z')
+    parts = [f'''<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="fr">
+    <title>CyberInsight</title>
+    <subtitle>Explorez les dernières menaces, vulnérabilités et techniques de protection dans le monde de la sécurité informatique</subtitle>
+    <link href="{SITE_URL}/{FEED_ATOM_PATH}" rel="self" type="application/atom+xml"/>
+    <link href="{SITE_URL}/" rel="alternate" type="text/html"/>
+    <id>{SITE_URL}/</id>
+    <updated>{updated}</updated>
+''']
+    for entry in entries:
+        article = entry['article']
+        terms = [xml_escape(term, {'"': '&quot;'}) for term in [article.category] + article.tags]
+        # L'extrait est déjà du HTML : ramené au texte avant l'échappement XML
+        summary = xml_escape(html_unescape(article.excerpt))
+        categories = ''.join(f'\n        <category term="{term}"/>' for term in terms)
+        parts.append(f'''    <entry>
+        <title>{xml_escape(article.title)}</title>
+        <link href="{entry['url']}" rel="alternate" type="text/html"/>
+        <id>{entry['id']}</id>
+        <published>{entry['updated']}</published>
+        <updated>{entry['updated']}</updated>
+        <author><name>{xml_escape(article.author)}</name></author>{categories}
+        <summary>{summary}</summary>
+    </entry>
+''')
+    parts.append('</feed>\n')
+    return ''.join(parts)
+
+def generate_json_feed(entries):
+    """JSON Feed 1.1 (feed.json), mêmes entrées que le flux Atom"""
+    feed = {
+        'version': 'https://jsonfeed.org/version/1.1',
+        'title': 'CyberInsight',
+        'home_page_url': f"{SITE_URL}/",
+        'feed_url': f"{SITE_URL}/{FEED_JSON_PATH}",
+        'description': 'Explorez les dernières menaces, vulnérabilités et techniques de protection dans le monde de la sécurité informatique',
+        'language': 'fr',
+        'items': [{
+            'id': entry['id'],
+            'url': entry['url'],
+            'title': entry['article'].title,
+            'summary': html_unescape(entry['article'].excerpt),
+            'content_text': html_unescape(entry['article'].excerpt),
+            'date_published': entry['updated'],
+            'date_modified': entry['updated'],
+            'authors': [{'name': entry['article'].author}],
+            'tags': [entry['article'].category] + entry['article'].tags,
+        } for entry in entries],
+    }
+    return json.dumps(feed, ensure_ascii=False, indent=1)
+
+def compressed_variants(path):
+    """Variantes précompressées d'une sortie : .gz, et .br si brotli est installé"""
+    variants = [path.with_name(path.name + '.gz')]
+    if brotli:
+        variants.append(path.with_name(path.name + '.br'))
+    return variants
+
+def compress_file(path):
+    """Écrit les variantes compressées d'un fichier au niveau maximal ; retourne le nombre de variantes écrites"""
+    with profile_stage('compression', path.relative_to(OUTPUT_DIR).as_posix()):
+        data = path.read_bytes()
+        written = 0
+        for variant in compressed_variants(path):
+            if variant.suffix == '.gz':
+                compressed = gzip.compress(data, compresslevel=9, mtime=0)  # mtime=0 : sortie reproductible
+            else:
+                compressed = brotli.compress(data, quality=11)
+            if write_if_changed(variant, compressed):
+                written += 1
+            else:
+                os.utime(variant)  # Variante identique mais à jour : plus récente que la source
+    return written
+
+def compress_outputs(jobs=1):
+    """Compresse les sorties HTML/CSS/JS/JSON plus récentes que leurs variantes et supprime les variantes orphelines"""
+    stale = []
+    for path in sorted(OUTPUT_DIR.rglob('*')):
+        if path.suffix in COMPRESSED_SUFFIXES:
+            # Variante d'une sortie supprimée, ou .br laissé par une installation de brotli disparue
+            if not path.with_suffix('').exists() or (path.suffix == '.br' and not brotli):
+                path.unlink()
+        elif path.suffix in COMPRESSIBLE_SUFFIXES and not path.name.startswith('.'):
+            # write_if_changed ne touche pas une sortie identique : sa date suffit à détecter un changement
+            mtime = path.stat().st_mtime_ns
+            if any(not variant.exists() or variant.stat().st_mtime_ns < mtime for variant in compressed_variants(path)):
+                stale.append(path)
+    
+    with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else contextlib.nullcontext() as pool:
+        written = sum(map_tasks(pool, compress_file, stale, jobs))
+    return len(stale), written
+
+def remove_compressed_outputs():
+    """Supprime toutes les variantes précompressées (build sans --compress après un build avec)"""
+    for suffix in COMPRESSED_SUFFIXES:
+        for path in OUTPUT_DIR.rglob(f"*{suffix}"):
+            path.unlink()
+
+def resolve_link(page, href):
+    """Cible d'un lien d'une page : (chemin relatif à _site/, ancre) ; None pour un lien externe"""
+    parts = urlsplit(href)
+    if parts.scheme or parts.netloc:
+        return None
+    fragment = unquote(parts.fragment)
+    if not parts.path:
+        return page, fragment
+    path = unquote(parts.path)
+    target = path.lstrip('/') if path.startswith('/') else posixpath.join(posixpath.dirname(page), path)
+    if path.endswith('/'):
+        target = posixpath.join(target, 'index.html')
+    return posixpath.normpath(target), fragment
+
+def page_stat(page):
+    """Date de modification et taille d'une page de _site/"""
+    stat = os.stat(OUTPUT_DIR / page)
+    return [stat.st_mtime_ns, stat.st_size]
+
+def scan_page_links(task):
+    """Identifiants et liens internes d'une page de _site/ ; l'analyse en cache est reprise si l'empreinte n'a pas changé"""
+    page, cached = task
+    stat = page_stat(page)
+    data = (OUTPUT_DIR / page).read_bytes()
+    digest = hash_bytes(data)
+    if cached and cached['hash'] == digest:
+        return dict(cached, stat=stat)
+    
+    ids = set()
+    links = {}
+    for tag in HTML_TAG.finditer(data.decode('utf-8')):
+        for name, double_quoted, single_quoted in HTML_LINK_ATTRIBUTE.findall(tag.group(2)):
+            value = html_unescape(double_quoted or single_quoted)
+            name = name.lower()
+            if name == 'id' or (name == 'name' and tag.group(1).lower() == 'a'):
+                ids.add(value)
+            elif name in ('href', 'src'):
+                if value not in links:
+                    links[value] = resolve_link(page, value)
+            elif name == 'srcset':
+                # Candidats « url largeur » séparés par des virgules
+                for candidate in value.split(','):
+                    url = candidate.split()[0] if candidate.strip() else ''
+                    if url and url not in links:
+                        links[url] = resolve_link(page, url)
+    return {
+        'stat': stat,
+        'hash': digest,
+        'ids': sorted(ids),
+        'links': [[href, *target] for href, target in links.items() if target is not None],
+    }
+
+def check_links(jobs=0):
+    """Vérifie les liens internes (href, src, srcset) et leurs ancres dans les pages de _site/ ; retourne les liens cassés
+    (jobs : processus pour l'analyse des pages, 0 = tous les cœurs comme --jobs 0)"""
+    jobs = jobs or os.cpu_count() or 1
+    files = set()
+    pages = []
+    for directory, _, names in os.walk(OUTPUT_DIR):
+        base = Path(directory).relative_to(OUTPUT_DIR).as_posix()
+        for name in names:
+            path = name if base == '.' else f"{base}/{name}"
+            files.add(path)
+            if name.endswith('.html'):
+                pages.append(path)
+    
+    # Le cache n'est valable que pour les attributs analysés lors de son écriture
+    try:
+        stored = json.loads(LINK_CACHE_PATH.read_text(encoding='utf-8'))
+        cache = stored['pages'] if stored.get('pattern') == HTML_LINK_ATTRIBUTE.pattern else {}
+    except (OSError, ValueError, KeyError, AttributeError):
+        cache = {}
+    
+    # Seules les pages modifiées depuis la dernière vérification sont relues et analysées, en parallèle
+    entries = {}
+    stale = []
+    for page in pages:
+        cached = cache.get(page)
+        if cached and cached['stat'] == page_stat(page):
+            entries[page] = cached
+        else:
+            stale.append((page, cached))
+    with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else contextlib.nullcontext() as pool:
+        entries.update(zip([page for page, _ in stale], map_tasks(pool, scan_page_links, stale, jobs)))
+    analysed = len(stale)
+    if analysed or len(entries) != len(cache):
+        LINK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(LINK_CACHE_PATH, json.dumps({'pattern': HTML_LINK_ATTRIBUTE.pattern, 'pages': entries},
+                                                     ensure_ascii=False, separators=(',', ':')))
+    
+    # Chaque lien contre l'ensemble des sorties et des identifiants de sa page cible
+    ids = {page: set(entry['ids']) for page, entry in entries.items()}
+    broken = []
+    for page in pages:
+        for href, target, fragment in entries[page]['links']:
+            if target not in files:
+                broken.append((page, href, 'fichier absent'))
+            elif fragment and fragment != 'top' and target in ids and fragment not in ids[target]:
+                broken.append((page, href, 'ancre absente'))
+    
+    print(f"  🔗 Liens internes : {len(pages)} page(s), {analysed} analysée(s), {len(broken)} lien(s) cassé(s)")
+    for page, href, reason in broken[:LINK_REPORT_LIMIT]:
+        print(f"    ❌ {page} → {href} ({reason})")
+    if len(broken) > LINK_REPORT_LIMIT:
+        print(f"    … et {len(broken) - LINK_REPORT_LIMIT} autre(s)")
+    return broken
+
+def list_article_sources():
+    """Sources Markdown des articles (les fichiers commençant par _ sont ignorés)"""
+    if not ARTICLES_DIR.exists():
+        return []
+    return [filepath for filepath in sorted(ARTICLES_DIR.glob("*.md"), key=lambda filepath: filepath.name)
+            if not filepath.name.startswith('_')]
+
+def source_stat(filepath):
+    """Clé de changement d'une source sans la lire : [mtime en ns, taille]"""
+    stat = filepath.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+def hash_bytes(data):
+    """Empreinte SHA-256 (hexadécimale) d'un contenu binaire"""
+    return hashlib.sha256(data).hexdigest()
+
+def hash_json(value):
+    """Empreinte stable d'une valeur sérialisable en JSON"""
+    return hash_bytes(json.dumps(value, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+
+def compute_template_version(assets):
+    """Version du générateur, des gabarits et des assets publiés : toute modification invalide le manifeste"""
+    h = hashlib.sha256(GENERATOR_VERSION.encode('utf-8'))
+    h.update(hash_json(assets).encode('utf-8'))
+    h.update(Path(__file__).read_bytes())
+    for name in sorted(SITE_ASSETS.values()):
+        h.update((ASSETS_DIR / name).read_bytes())
+    for path in sorted(TEMPLATES_DIR.glob("*.html")):
+        h.update(path.name.encode('utf-8'))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+def load_manifest():
+    """Charge le manifeste du build précédent (vide s'il est absent ou illisible)"""
+    try:
+        return json.loads(MANIFEST_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest):
+    """Enregistre le manifeste de build dans _site/"""
+    return write_if_changed(MANIFEST_PATH, json.dumps(manifest, ensure_ascii=False, separators=(',', ':'),
+                                                      sort_keys=True))
+
+def load_terms_cache(template_version):
+    """Termes de recherche des sources du build précédent : empreintes couvertes et terme → empreintes
+    (vides si le cache est absent, illisible ou périmé)"""
+    try:
+        cache = json.loads(TERMS_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return set(), {}
+    if cache.get('template_version') != template_version:
+        return set(), {}
+    sources = cache['sources']
+    return set(sources), {term: [sources[i] for i in ids] for term, ids in cache['postings'].items()}
+
+def save_terms_cache(template_version, postings, entries):
+    """Enregistre les listes de l'index par empreinte de source (entries : articles du manifeste, par slug)"""
+    sources = {}
+    cached = {}
+    for term, slugs in postings.items():
+        cached[term] = sorted({sources.setdefault(entries[slug]['source_hash'], len(sources)) for slug in slugs})
+    TERMS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(TERMS_CACHE_PATH, json.dumps({'template_version': template_version, 'sources': list(sources),
+                                                   'postings': cached},
+                                                  ensure_ascii=False, separators=(',', ':'), sort_keys=True))
+
+def article_meta(article):
+    """Métadonnées d'un article sans son contenu HTML"""
+    return {field: getattr(article, field) for field in META_FIELDS}
+
+def article_render_key(source_hash, related_articles, images, tag_slugs):
+    """Clé de rendu d'une page article : source + cartes des articles liés + images publiées + slugs des tags"""
+    related = [[r.slug, r.category, r.title, r.excerpt] for r in related_articles]
+    return hash_json({'source': source_hash, 'related': related, 'images': images, 'tags': tag_slugs})
+
+def listing_summary(page):
+    """Page de listing avec les slugs de ses articles au lieu des articles (comparable d'un build à l'autre)"""
+    home = page['home']
+    if home:
+        home = dict(home, featured=home['featured'] and home['featured'].slug)
+    return dict(page, articles=[a.slug for a in page['articles']], home=home)
+
+def listing_render_key(page):
+    """Clé de rendu d'une page de listing : tout ce qui y est affiché (voir plan_listing_pages)"""
+    return hash_json(dict(listing_summary(page), articles=[[a.slug, article_meta(a)] for a in page['articles']]))
+
+def remove_output(relative_path):
+    """Supprime une page générée qui n'existe plus, ainsi que son dossier s'il est devenu vide"""
+    output_path = OUTPUT_DIR / relative_path
+    output_path.unlink(missing_ok=True)
+    if output_path.parent != OUTPUT_DIR and not any(output_path.parent.iterdir()):
+        output_path.parent.rmdir()
+
+class BuildState:
+    """Résultats du dernier build gardés en mémoire par serve pour le suivant : manifeste, listes de l'index
+    de recherche, images publiées, slugs des tags et clés des pages de listing"""
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        """Oublie le dernier build (repris par un build en cours : s'il échoue, le suivant repart des caches disque)"""
+        self.manifest = None
+        self.postings = None
+        self.images = None
+        self.tag_slugs = None
+        self.listing_keys = {}
+
+class BuildProfiler:
+    """Temps mur et CPU de chaque étape du build, par article (activé par --profile)"""
+    
+    def __init__(self):
+        self.records = []  # (étape, slug ou page, temps mur, temps CPU)
+    
+    @contextlib.contextmanager
+    def stage(self, stage, item=None):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.records.append((stage, item, time.perf_counter() - wall, time.process_time() - cpu))
+    
+    def report(self, article_slugs, top=10):
+        """Affiche les totaux par étape et les articles les plus lents"""
+        totals = {}
+        per_article = {}
+        for stage, item, wall, cpu in self.records:
+            total = totals.setdefault(stage, [0.0, 0.0, 0])
+            total[0] += wall
+            total[1] += cpu
+            total[2] += 1
+            if item in article_slugs:
+                stages = per_article.setdefault(item, {})
+                stages[stage] = stages.get(stage, 0.0) + wall
         
-        articles_html += f'''
-        <article class="article-card" data-category="{article['category']}">
-            <div class="article-meta">
-                <span class="article-category">{article['category']}</span>
-                <span>•</span>
-                <span>{format_date(article['date'])}</span>
-                <span>•</span>
-                <span class="reading-time">⏱️ {article['reading_time']} min</span>
-            </div>
-            <h3>{article['title']}</h3>
-            <p class="article-excerpt">{article['excerpt']}</p>
-            <div class="article-card-footer">
-                <a href="articles/{article['slug']}.html" class="read-more">Lire plus</a>
-                {f'<div class="tags-preview">{tags_preview}</div>' if tags_preview else ''}
-            </div>
-        </article>
-        '''
-    
-    featured_html = ''
-    if featured:
-        featured_html = f'''
-        <div class="featured-article">
-            <span class="featured-label">⭐ Article en vedette</span>
-            <div class="featured-meta">
-                <span class="featured-category">{featured['category']}</span>
-                <span>•</span>
-                <span>{format_date(featured['date'])}</span>
-                <span>•</span>
-                <span>⏱️ {featured['reading_time']} min</span>
-            </div>
-            <h2>{featured['title']}</h2>
-            <p>{featured['excerpt']}</p>
-            <a href="articles/{featured['slug']}.html" class="read-more">Lire l'article complet</a>
-        </div>
-        '''
-    
-    # Statistiques
-    total_articles = len(articles)
-    total_reading_time = sum(a['reading_time'] for a in articles)
-    all_categories = len(categories)
-    
-    html = f'''<!DOCTYPE html>
-<html lang="fr" data-theme="dark">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CyberInsight - Blog de Cybersécurité</title>
-    <meta name="description" content="Explorez les dernières menaces, vulnérabilités et techniques de protection dans le monde de la sécurité informatique">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600;700&family=Poppins:wght@300;400;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root[data-theme="dark"] {{
-            --color-bg: #0a0e17;
-            --color-surface: #151922;
-            --color-surface-elevated: #1e232e;
-            --color-primary: #00f5a0;
-            --color-secondary: #00d9ff;
-            --color-accent: #ff006e;
-            --color-text: #e8ecf3;
-            --color-text-muted: #8b92a8;
-            --color-border: #2a3142;
-        }}
-
-        :root[data-theme="light"] {{
-            --color-bg: #ffffff;
-            --color-surface: #f8f9fa;
-            --color-surface-elevated: #ffffff;
-            --color-primary: #00a870;
-            --color-secondary: #0088cc;
-            --color-accent: #e91e63;
-            --color-text: #1a1a1a;
-            --color-text-muted: #6c757d;
-            --color-border: #dee2e6;
-        }}
-
-        :root {{
-            --font-display: 'JetBrains Mono', monospace;
-            --font-body: 'Poppins', sans-serif;
-            --shadow-glow: 0 0 30px rgba(0, 245, 160, 0.15);
-            --shadow-strong: 0 20px 50px rgba(0, 0, 0, 0.5);
-        }}
-
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-
-        body {{
-            font-family: var(--font-body);
-            background: var(--color-bg);
-            color: var(--color-text);
-            line-height: 1.7;
-            overflow-x: hidden;
-            transition: background 0.3s ease, color 0.3s ease;
-        }}
-
-        body::before {{
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: 
-                radial-gradient(circle at 20% 50%, rgba(0, 245, 160, 0.05) 0%, transparent 50%),
-                radial-gradient(circle at 80% 80%, rgba(0, 217, 255, 0.05) 0%, transparent 50%);
-            pointer-events: none;
-            z-index: 0;
-            opacity: 0.5;
-            transition: opacity 0.3s ease;
-        }}
-
-        [data-theme="light"] body::before {{
-            opacity: 0.2;
-        }}
-
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            position: relative;
-            z-index: 1;
-        }}
-
-        header {{
-            padding: 2rem 0;
-            border-bottom: 1px solid var(--color-border);
-            backdrop-filter: blur(10px);
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            background: var(--color-bg);
-            animation: slideDown 0.6s ease-out;
-            transition: all 0.3s ease;
-        }}
-
-        @keyframes slideDown {{
-            from {{ transform: translateY(-100%); opacity: 0; }}
-            to {{ transform: translateY(0); opacity: 1; }}
-        }}
-
-        .header-content {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-
-        .logo {{
-            font-family: var(--font-display);
-            font-size: 1.8rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, var(--color-primary), var(--color-secondary));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            letter-spacing: -0.02em;
-            position: relative;
-        }}
-
-        .logo::before {{
-            content: '> ';
-            color: var(--color-accent);
-            -webkit-text-fill-color: var(--color-accent);
-            animation: blink 1.5s infinite;
-        }}
-
-        @keyframes blink {{
-            0%, 49% {{ opacity: 1; }}
-            50%, 100% {{ opacity: 0; }}
-        }}
-
-        nav {{
-            display: flex;
-            gap: 2.5rem;
-            align-items: center;
-        }}
-
-        nav a {{
-            color: var(--color-text-muted);
-            text-decoration: none;
-            font-weight: 500;
-            font-size: 0.95rem;
-            transition: all 0.3s ease;
-            position: relative;
-        }}
-
-        nav a::after {{
-            content: '';
-            position: absolute;
-            bottom: -5px;
-            left: 0;
-            width: 0;
-            height: 2px;
-            background: var(--color-primary);
-            transition: width 0.3s ease;
-        }}
-
-        nav a:hover {{
-            color: var(--color-primary);
-        }}
-
-        nav a:hover::after {{
-            width: 100%;
-        }}
-
-        /* Theme Toggle */
-        .theme-toggle {{
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            border-radius: 50px;
-            padding: 0.5rem;
-            cursor: pointer;
-            font-size: 1.2rem;
-            transition: all 0.3s ease;
-            width: 40px;
-            height: 40px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-
-        .theme-toggle:hover {{
-            border-color: var(--color-primary);
-            transform: rotate(180deg);
-        }}
-
-        /* Stats Bar */
-        .stats-bar {{
-            padding: 1.5rem 0;
-            display: flex;
-            justify-content: center;
-            gap: 3rem;
-            flex-wrap: wrap;
-            border-bottom: 1px solid var(--color-border);
-            animation: fadeInUp 0.8s ease-out 0.1s both;
-        }}
-
-        .stat {{
-            text-align: center;
-        }}
-
-        .stat-number {{
-            font-size: 2rem;
-            font-weight: 700;
-            font-family: var(--font-display);
-            background: linear-gradient(135deg, var(--color-primary), var(--color-secondary));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }}
-
-        .stat-label {{
-            font-size: 0.9rem;
-            color: var(--color-text-muted);
-            margin-top: 0.3rem;
-        }}
-
-        /* Search and Filter Section */
-        .search-filter-section {{
-            padding: 2rem 0;
-            border-bottom: 1px solid var(--color-border);
-            animation: fadeInUp 0.8s ease-out 0.3s both;
-        }}
-
-        .search-bar {{
-            display: flex;
-            gap: 1rem;
-            margin-bottom: 2rem;
-            align-items: center;
-        }}
-
-        .search-input {{
-            flex: 1;
-            padding: 1rem 1.5rem;
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            border-radius: 8px;
-            color: var(--color-text);
-            font-family: var(--font-body);
-            font-size: 1rem;
-            transition: all 0.3s ease;
-        }}
-
-        .search-input:focus {{
-            outline: none;
-            border-color: var(--color-primary);
-            box-shadow: 0 0 0 3px rgba(0, 245, 160, 0.1);
-        }}
-
-        .search-input::placeholder {{
-            color: var(--color-text-muted);
-        }}
-
-        .category-filters {{
-            display: flex;
-            gap: 1rem;
-            flex-wrap: wrap;
-            justify-content: center;
-        }}
-
-        .filter-btn {{
-            padding: 0.6rem 1.2rem;
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            border-radius: 6px;
-            color: var(--color-text-muted);
-            font-family: var(--font-display);
-            font-size: 0.85rem;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }}
-
-        .filter-btn:hover {{
-            border-color: var(--color-primary);
-            color: var(--color-primary);
-            transform: translateY(-2px);
-        }}
-
-        .filter-btn.active {{
-            background: var(--color-primary);
-            color: var(--color-bg);
-            border-color: var(--color-primary);
-            box-shadow: var(--shadow-glow);
-        }}
-
-        .no-results {{
-            text-align: center;
-            padding: 4rem 2rem;
-            color: var(--color-text-muted);
-            font-size: 1.2rem;
-        }}
-
-        .no-results-icon {{
-            font-size: 4rem;
-            margin-bottom: 1rem;
-            opacity: 0.3;
-        }}
-
-        .article-card.hidden {{
-            display: none;
-        }}
-
-        .hero {{
-            padding: 6rem 0;
-            text-align: center;
-            animation: fadeInUp 0.8s ease-out 0.2s both;
-        }}
-
-        @keyframes fadeInUp {{
-            from {{ opacity: 0; transform: translateY(30px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
-
-        .hero h1 {{
-            font-family: var(--font-display);
-            font-size: 4rem;
-            font-weight: 700;
-            margin-bottom: 1.5rem;
-            line-height: 1.1;
-            letter-spacing: -0.03em;
-        }}
-
-        .hero h1 .gradient-text {{
-            background: linear-gradient(135deg, var(--color-primary), var(--color-secondary), var(--color-accent));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            background-size: 200% 200%;
-            animation: gradientShift 5s ease infinite;
-        }}
-
-        @keyframes gradientShift {{
-            0%, 100% {{ background-position: 0% 50%; }}
-            50% {{ background-position: 100% 50%; }}
-        }}
-
-        .hero p {{
-            font-size: 1.3rem;
-            color: var(--color-text-muted);
-            max-width: 700px;
-            margin: 0 auto 2rem;
-        }}
-
-        .hero-tags {{
-            display: flex;
-            gap: 1rem;
-            justify-content: center;
-            flex-wrap: wrap;
-            margin-top: 2rem;
-        }}
-
-        .tag {{
-            padding: 0.5rem 1rem;
-            background: var(--color-surface-elevated);
-            border: 1px solid var(--color-border);
-            border-radius: 6px;
-            font-family: var(--font-display);
-            font-size: 0.85rem;
-            color: var(--color-primary);
-            transition: all 0.3s ease;
-            cursor: default;
-        }}
-
-        .tag:hover {{
-            background: var(--color-primary);
-            color: var(--color-bg);
-            border-color: var(--color-primary);
-            box-shadow: var(--shadow-glow);
-            transform: translateY(-2px);
-        }}
-
-        .articles-section {{
-            padding: 4rem 0;
-            animation: fadeInUp 0.8s ease-out 0.4s both;
-        }}
-
-        .section-title {{
-            font-family: var(--font-display);
-            font-size: 2rem;
-            margin-bottom: 3rem;
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-        }}
-
-        .section-title::before {{
-            content: '#';
-            color: var(--color-accent);
-            font-size: 2.5rem;
-        }}
-
-        .articles-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
-            gap: 2rem;
-        }}
-
-        .article-card {{
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            border-radius: 12px;
-            padding: 2rem;
-            transition: all 0.4s ease;
-            position: relative;
-            overflow: hidden;
-            display: flex;
-            flex-direction: column;
-        }}
-
-        .article-card::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 4px;
-            background: linear-gradient(90deg, var(--color-primary), var(--color-secondary));
-            transform: scaleX(0);
-            transform-origin: left;
-            transition: transform 0.4s ease;
-        }}
-
-        .article-card:hover::before {{
-            transform: scaleX(1);
-        }}
-
-        .article-card:hover {{
-            transform: translateY(-8px);
-            box-shadow: var(--shadow-strong);
-            border-color: var(--color-primary);
-        }}
-
-        .article-meta {{
-            display: flex;
-            gap: 1rem;
-            margin-bottom: 1rem;
-            font-size: 0.85rem;
-            color: var(--color-text-muted);
-            font-family: var(--font-display);
-            flex-wrap: wrap;
-        }}
-
-        .article-category {{
-            color: var(--color-primary);
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }}
-
-        .reading-time {{
-            display: flex;
-            align-items: center;
-            gap: 0.3rem;
-        }}
-
-        .article-card h3 {{
-            font-size: 1.5rem;
-            margin-bottom: 1rem;
-            color: var(--color-text);
-            line-height: 1.3;
-            transition: color 0.3s ease;
-        }}
-
-        .article-card:hover h3 {{
-            color: var(--color-primary);
-        }}
-
-        .article-excerpt {{
-            color: var(--color-text-muted);
-            margin-bottom: 1.5rem;
-            line-height: 1.6;
-            flex-grow: 1;
-        }}
-
-        .article-card-footer {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            gap: 1rem;
-        }}
-
-        .tags-preview {{
-            color: var(--color-text-muted);
-            font-size: 0.85rem;
-            font-family: var(--font-display);
-        }}
-
-        .read-more {{
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-            color: var(--color-secondary);
-            text-decoration: none;
-            font-weight: 600;
-            font-size: 0.9rem;
-            transition: gap 0.3s ease;
-            white-space: nowrap;
-        }}
-
-        .read-more:hover {{
-            gap: 1rem;
-        }}
-
-        .read-more::after {{
-            content: '→';
-            font-size: 1.2rem;
-        }}
-
-        .featured-article {{
-            background: linear-gradient(135deg, var(--color-surface-elevated), var(--color-surface));
-            border: 1px solid var(--color-primary);
-            border-radius: 16px;
-            padding: 3rem;
-            margin-bottom: 4rem;
-            position: relative;
-            overflow: hidden;
-            box-shadow: var(--shadow-glow);
-            animation: fadeInUp 0.8s ease-out 0.6s both;
-        }}
-
-        .featured-label {{
-            display: inline-block;
-            background: var(--color-accent);
-            color: var(--color-bg);
-            padding: 0.4rem 1rem;
-            border-radius: 6px;
-            font-family: var(--font-display);
-            font-size: 0.8rem;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-            margin-bottom: 1rem;
-        }}
-
-        .featured-meta {{
-            font-size: 0.9rem;
-            color: var(--color-text-muted);
-            font-family: var(--font-display);
-            margin-bottom: 1.5rem;
-            display: flex;
-            gap: 1rem;
-            flex-wrap: wrap;
-        }}
-
-        .featured-category {{
-            color: var(--color-primary);
-            text-transform: uppercase;
-        }}
-
-        .featured-article h2 {{
-            font-size: 2.5rem;
-            margin-bottom: 1rem;
-            line-height: 1.2;
-        }}
-
-        .featured-article p {{
-            font-size: 1.1rem;
-            color: var(--color-text-muted);
-            margin-bottom: 2rem;
-        }}
-
-        /* Back to Top Button */
-        .back-to-top {{
-            position: fixed;
-            bottom: 2rem;
-            right: 2rem;
-            width: 50px;
-            height: 50px;
-            background: var(--color-primary);
-            color: var(--color-bg);
-            border: none;
-            border-radius: 50%;
-            font-size: 1.5rem;
-            cursor: pointer;
-            opacity: 0;
-            pointer-events: none;
-            transition: all 0.3s ease;
-            z-index: 1000;
-            box-shadow: 0 4px 12px rgba(0, 245, 160, 0.3);
-        }}
-
-        .back-to-top.visible {{
-            opacity: 1;
-            pointer-events: all;
-        }}
-
-        .back-to-top:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 20px rgba(0, 245, 160, 0.4);
-        }}
-
-        footer {{
-            border-top: 1px solid var(--color-border);
-            padding: 3rem 0;
-            margin-top: 6rem;
-            text-align: center;
-            color: var(--color-text-muted);
-        }}
-
-        @media (max-width: 768px) {{
-            .hero h1 {{ font-size: 2.5rem; }}
-            .hero p {{ font-size: 1.1rem; }}
-            nav {{ gap: 1rem; }}
-            nav a {{ font-size: 0.85rem; }}
-            .articles-grid {{ grid-template-columns: 1fr; }}
-            .featured-article {{ padding: 2rem; }}
-            .featured-article h2 {{ font-size: 1.8rem; }}
-            .search-filter-section {{ padding: 1.5rem 0; }}
-            .category-filters {{ gap: 0.5rem; }}
-            .stats-bar {{ gap: 1.5rem; }}
-            .stat-number {{ font-size: 1.5rem; }}
-            .back-to-top {{
-                bottom: 1rem;
-                right: 1rem;
-                width: 45px;
-                height: 45px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <header>
-        <div class="container">
-            <div class="header-content">
-                <div class="logo">CyberInsight</div>
-                <nav>
-                    <a href="#articles">Articles</a>
-                    <a href="https://github.com/voidsponge" target="_blank">GitHub</a>
-                    <button class="theme-toggle" id="themeToggle" aria-label="Toggle theme">
-                        <span id="themeIcon">🌙</span>
-                    </button>
-                </nav>
-            </div>
-        </div>
-    </header>
-
-    <main>
-        <section class="stats-bar">
-            <div class="stat">
-                <div class="stat-number">{total_articles}</div>
-                <div class="stat-label">Articles</div>
-            </div>
-            <div class="stat">
-                <div class="stat-number">{all_categories}</div>
-                <div class="stat-label">Catégories</div>
-            </div>
-            <div class="stat">
-                <div class="stat-number">{total_reading_time}</div>
-                <div class="stat-label">Minutes de lecture</div>
-            </div>
-        </section>
-
-        <section class="hero">
-            <div class="container">
-                <h1><span class="gradient-text">Décryptage de la Cybersécurité</span></h1>
-                <p>Explorez les dernières menaces, vulnérabilités et techniques de protection dans le monde de la sécurité informatique</p>
-                <div class="hero-tags">
-                    <span class="tag">DevSecOps</span>
-                    <span class="tag">Forensic</span>
-                    <span class="tag">CTF</span>
-                    <span class="tag">Cheat</span>
-                    <span class="tag">OSINT</span>
-                    <span class="tag">Red Team / Blue Team</span>
-                </div>
-            </div>
-        </section>
-
-        <section class="search-filter-section">
-            <div class="container">
-                <div class="search-bar">
-                    <input type="text" 
-                           id="searchInput" 
-                           class="search-input" 
-                           placeholder="🔍 Rechercher un article...">
-                </div>
-                <div class="category-filters" id="categoryFilters">
-                    <button class="filter-btn active" data-category="all">Tous</button>
-                    {category_filters}
-                </div>
-            </div>
-        </section>
-
-        <section class="articles-section">
-            <div class="container">
-                {featured_html}
-
-                <h2 class="section-title" id="articles">Articles récents</h2>
-                
-                <div class="articles-grid" id="articlesGrid">
-                    {articles_html}
-                </div>
-                <div class="no-results" id="noResults" style="display: none;">
-                    <div class="no-results-icon">🔍</div>
-                    <p>Aucun article trouvé</p>
-                </div>
-            </div>
-        </section>
-    </main>
-
-    <button class="back-to-top" id="backToTop" aria-label="Retour en haut">↑</button>
-
-    <footer>
-        <div class="container">
-            <p>&copy; 2025 CyberInsight. Tous droits réservés.</p>
-        </div>
-    </footer>
-
-    <script>
-        // Theme Toggle
-        const themeToggle = document.getElementById('themeToggle');
-        const themeIcon = document.getElementById('themeIcon');
-        const html = document.documentElement;
-
-        // Load saved theme
-        const savedTheme = localStorage.getItem('theme') || 'dark';
-        html.setAttribute('data-theme', savedTheme);
-        updateThemeIcon(savedTheme);
-
-        themeToggle.addEventListener('click', () => {{
-            const currentTheme = html.getAttribute('data-theme');
-            const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
-            html.setAttribute('data-theme', newTheme);
-            localStorage.setItem('theme', newTheme);
-            updateThemeIcon(newTheme);
-        }});
-
-        function updateThemeIcon(theme) {{
-            themeIcon.textContent = theme === 'dark' ? '🌙' : '☀️';
-        }}
-
-        // Search
-        const searchInput = document.getElementById('searchInput');
-        const articlesGrid = document.getElementById('articlesGrid');
-        const noResults = document.getElementById('noResults');
-        const articleCards = articlesGrid.querySelectorAll('.article-card');
-
-        searchInput.addEventListener('input', function() {{
-            const searchTerm = this.value.toLowerCase();
-            let visibleCount = 0;
-
-            articleCards.forEach(card => {{
-                const title = card.querySelector('h3').textContent.toLowerCase();
-                const excerpt = card.querySelector('.article-excerpt').textContent.toLowerCase();
-                const category = card.querySelector('.article-category').textContent.toLowerCase();
-                
-                const matches = title.includes(searchTerm) || 
-                               excerpt.includes(searchTerm) || 
-                               category.includes(searchTerm);
-
-                if (matches) {{
-                    card.classList.remove('hidden');
-                    visibleCount++;
-                }} else {{
-                    card.classList.add('hidden');
-                }}
-            }});
-
-            noResults.style.display = visibleCount === 0 ? 'block' : 'none';
-        }});
-
-        // Filtrage par catégorie
-        const filterButtons = document.querySelectorAll('.filter-btn');
-
-        filterButtons.forEach(button => {{
-            button.addEventListener('click', function() {{
-                filterButtons.forEach(btn => btn.classList.remove('active'));
-                this.classList.add('active');
-
-                const category = this.getAttribute('data-category');
-                let visibleCount = 0;
-
-                articleCards.forEach(card => {{
-                    const cardCategory = card.querySelector('.article-category').textContent;
-                    
-                    if (category === 'all' || cardCategory === category) {{
-                        card.classList.remove('hidden');
-                        visibleCount++;
-                    }} else {{
-                        card.classList.add('hidden');
-                    }}
-                }});
-
-                searchInput.value = '';
-                noResults.style.display = visibleCount === 0 ? 'block' : 'none';
-            }});
-        }});
-
-        // Back to Top
-        const backToTop = document.getElementById('backToTop');
-
-        window.addEventListener('scroll', () => {{
-            if (window.pageYOffset > 300) {{
-                backToTop.classList.add('visible');
-            }} else {{
-                backToTop.classList.remove('visible');
-            }}
-        }});
-
-        backToTop.addEventListener('click', () => {{
-            window.scrollTo({{
-                top: 0,
-                behavior: 'smooth'
-            }});
-        }});
-    </script>
-</body>
-</html>'''
-    
-    return html
-
-def main():
-    """Fonction principale"""
+        print("⏱️  Profil du build (ms)")
+        print(f"  {'étape':<16}{'mur':>10}{'CPU':>10}{'appels':>8}{'moyenne':>10}")
+        for stage, (wall, cpu, calls) in totals.items():
+            print(f"  {stage:<16}{wall * 1000:>10.1f}{cpu * 1000:>10.1f}{calls:>8}{wall * 1000 / calls:>10.2f}")
+        
+        slowest = sorted(per_article.items(), key=lambda item: sum(item[1].values()), reverse=True)[:top]
+        if slowest:
+            print(f"  🐢 {len(slowest)} article(s) les plus lents :")
+            for slug, stages in slowest:
+                detail = ', '.join(f"{stage} {wall * 1000:.1f}" for stage, wall in
+                                   sorted(stages.items(), key=lambda item: item[1], reverse=True))
+                print(f"    {sum(stages.values()) * 1000:>8.1f} ms  {slug}  ({detail})")
+
+# Profileur actif (--profile) ; None sinon
+PROFILER = None
+
+def profile_stage(stage, item=None):
+    """Mesure une étape du build si --profile est actif (contexte vide sinon)"""
+    if PROFILER is None:
+        return contextlib.nullcontext()
+    return PROFILER.stage(stage, item)
+
+def write_rendered_page(output_path, render, item):
+    """Écrit la page produite par render() (flux de morceaux) avec write_chunks_if_changed ; avec --profile,
+    la production des morceaux (étape « rendu ») et leur comparaison et écriture (étape « écriture ») sont
+    entrelacées mais mesurées séparément"""
+    if PROFILER is None:
+        return write_chunks_if_changed(output_path, render())
+    spent = [0.0, 0.0]  # Temps mur et CPU passés dans le rendu
+    
+    def timed(func):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            return func()
+        finally:
+            spent[0] += time.perf_counter() - wall
+            spent[1] += time.process_time() - cpu
+    
+    def chunks():
+        iterator = timed(lambda: iter(render()))
+        while True:
+            try:
+                chunk = timed(lambda: next(iterator))
+            except StopIteration:
+                return
+            yield chunk
+    
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        return write_chunks_if_changed(output_path, chunks())
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        PROFILER.records.append(('rendu', item, spent[0], spent[1]))
+        PROFILER.records.append(('écriture', item, wall - spent[0], cpu - spent[1]))
+
+def run_profiled(task):
+    """Exécute func(item) dans un processus du pool et renvoie ses mesures avec le résultat"""
+    global PROFILER
+    func, item = task
+    PROFILER = BuildProfiler()
+    try:
+        return func(item), PROFILER.records
+    finally:
+        PROFILER = None
+
+def map_tasks(pool, func, items, jobs=1):
+    """Applique func à chaque élément, dans le pool de processus s'il existe (ordre conservé)"""
+    if pool is None or len(items) < 2:
+        return [func(item) for item in items]
+    chunksize = max(1, len(items) // (jobs * 4))
+    if PROFILER is None:
+        return list(pool.map(func, items, chunksize=chunksize))
+    
+    # Les mesures prises dans les processus du pool sont rapatriées dans le profileur principal
+    results = []
+    for result, records in pool.map(run_profiled, [(func, item) for item in items], chunksize=chunksize):
+        results.append(result)
+        PROFILER.records.extend(records)
+    return results
+
+def write_article_page(task):
+    """Génère et écrit la page d'un article (exécutable dans un processus du pool) ; retourne True si écrite"""
+    article, related_articles, assets, images, tag_slugs = task
+    try:
+        return write_rendered_page(ARTICLES_OUTPUT / f"{article.slug}.html",
+                                   lambda: iter_article_page(article, related_articles, assets, images, tag_slugs),
+                                   article.slug)
+    finally:
+        article.release()
+
+def parse_args(argv=None):
+    """Analyse les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Génère le blog CyberInsight dans _site/")
+    parser.add_argument('command', nargs='?', choices=['build', 'serve', 'fetch-fonts'], default='build',
+                        help="build : génère le site (défaut) ; serve : serveur local avec reconstruction à chaud ; "
+                             "fetch-fonts : télécharge les polices absentes de _vendor/fonts/")
+    parser.add_argument('--incremental', action='store_true',
+                        help="ne régénère que les pages dont les sources ont changé (manifeste _site/.manifest.json)")
+    parser.add_argument('--only', choices=['index'],
+                        help="index : ne régénère que l'accueil et les listings, depuis les métadonnées des articles "
+                             "(manifeste du dernier build, ou frontmatter et premier paragraphe des sources modifiées)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help="nombre de processus pour la conversion et le rendu (0 = tous les cœurs)")
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE, metavar='N',
+                        help=f"nombre d'articles par page de listing (défaut : {PAGE_SIZE})")
+    parser.add_argument('--feed-size', type=int, default=FEED_SIZE, metavar='N',
+                        help=f"nombre d'articles dans feed.xml et feed.json (défaut : {FEED_SIZE})")
+    parser.add_argument('--compress', action='store_true',
+                        help="écrit aussi des variantes .gz (et .br si le module brotli est installé) "
+                             "des fichiers HTML/CSS/JS/JSON modifiés")
+    parser.add_argument('--check-links', action='store_true',
+                        help="vérifie ensuite les liens internes et les ancres de toutes les pages de _site/ "
+                             "(code de sortie 1 si un lien est cassé)")
+    parser.add_argument('--profile', action='store_true',
+                        help="mesure le temps mur et CPU de chaque étape, par article et au total")
+    parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                        help="nombre d'articles les plus lents affichés par --profile (défaut : 10)")
+    parser.add_argument('--profile-out', metavar='FICHIER',
+                        help="enregistre aussi un profil cProfile (lisible avec pstats) ; implique --profile")
+    parser.add_argument('--cache-size', type=int, default=RENDER_CACHE_MAX_BYTES // (1024 * 1024), metavar='Mo',
+                        help="taille maximale du cache de conversion Markdown .cache/render/ "
+                             f"(défaut : {RENDER_CACHE_MAX_BYTES // (1024 * 1024)} Mo)")
+    parser.add_argument('--host', default='127.0.0.1', help="adresse d'écoute de serve (défaut : 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8000, help="port d'écoute de serve (défaut : 8000)")
+    args = parser.parse_args(argv)
+    if args.page_size < 1:
+        parser.error("--page-size doit être au moins 1")
+    if args.feed_size < 0:
+        parser.error("--feed-size ne peut pas être négatif")
+    if args.cache_size < 0:
+        parser.error("--cache-size ne peut pas être négatif")
+    if args.jobs < 1:
+        args.jobs = os.cpu_count() or 1
+    return args
+
+def build(args, state=None):
+    """Génère le site complet (ou seulement ce qui a changé avec args.incremental) ;
+    state : résultats du build précédent gardés en mémoire par serve (voir BuildState), mis à jour"""
     print("🚀 Génération du blog CyberInsight amélioré...")
     
+    if args.only == 'index':
+        articles = build_index_only(args)
+        if articles is not None:
+            return articles
+        print("  ⚠️  Aucun build complet à jour dans _site/ : génération complète")
+    
     # Créer les dossiers de sortie
     OUTPUT_DIR.mkdir(exist_ok=True)
     ARTICLES_OUTPUT.mkdir(exist_ok=True)
     
-    # Charger tous les articles
+    # Fichiers écrits (True) ou laissés intacts car identiques (False)
+    writes = Counter()
+    assets = build_assets(writes)
+    load_template.cache_clear()  # Gabarits relus à chaque build (serve les surveille)
+    
+    # Build précédent : gardé en mémoire par serve, sinon relu depuis le manifeste de _site/
+    kept = state.manifest if state is not None else None
+    manifest = kept if kept is not None else load_manifest()
+    postings = state.postings if state is not None else None
+    listing_keys = state.listing_keys if state is not None else {}
+    kept_images = state.images if state is not None else None
+    kept_tag_slugs = state.tag_slugs if state is not None else None
+    if state is not None:
+        state.clear()
+    
+    # Sources du corpus (leurs caractères servent à réduire les polices) : une source dont la clé de changement
+    # (mtime, taille) est celle du build précédent garde son empreinte sans être relue
+    known = manifest.get('articles', {}) if args.incremental else {}
+    sources = []
+    for filepath in list_article_sources():
+        stat = source_stat(filepath)
+        entry = known.get(filepath.stem)
+        source_hash = entry['source_hash'] if entry and entry.get('stat') == stat else hash_bytes(filepath.read_bytes())
+        sources.append((filepath, source_hash, stat))
+    assets.update(build_vendor_assets(writes, sources))
+    
+    # Manifeste du build précédent : réutilisable seulement si le générateur et les assets n'ont pas changé,
+    # mais toujours consulté pour supprimer les pages qui n'existent plus
+    template_version = compute_template_version(assets)
+    reusable = args.incremental and manifest.get('template_version') == template_version
+    previous = manifest.get('articles', {}) if reusable else {}
+    previous_pages = manifest.get('pages', {}) if reusable else {}
+    entries = {}
+    
+    # Listes de l'index de recherche (terme → slugs) : celles que serve a gardées, sinon remplies au chargement
+    # et complétées par le cache des termes pour les sources inchangées
+    kept_postings = postings is not None and reusable
+    if kept_postings:
+        cached_sources, previous_postings = {entry['source_hash'] for entry in previous.values()}, {}
+    else:
+        postings = {}
+        cached_sources, previous_postings = load_terms_cache(template_version) if reusable else (set(), {})
+    
+    # Sources à (re)convertir : nouvelles ou modifiées depuis le dernier build
+    changed = {}
+    for filepath, source_hash, _ in sources:
+        entry = previous.get(filepath.stem)
+        if not entry or entry['source_hash'] != source_hash or source_hash not in cached_sources:
+            print(f"  📄 Traitement de {filepath.name}...")
+            changed[filepath] = hash_json(read_frontmatter(filepath))
+    current = {filepath.stem for filepath, _, _ in sources}
+    removed = [slug for slug in previous if slug not in current]
+    
+    pool = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+    try:
+        # Charger tous les articles (les sources inchangées réutilisent les métadonnées du manifeste)
+        loaded = dict(zip(changed, map_tasks(pool, load_article, list(changed), args.jobs)))
+        
+        # Articles reconvertis ou retirés : leurs anciens termes sortent des listes (et disent si l'index change)
+        old_terms = remove_postings(postings, [filepath.stem for filepath in loaded] + removed) if kept_postings else {}
+        search_changed = not kept_postings or bool(removed)
+        
+        # Ce qui a changé depuis le build précédent : métadonnées (cartes des listings et des articles liés),
+        # catégories et tags dont la liste d'articles a bougé (ajout, retrait, date, catégorie ou tags modifiés)
+        meta_changed = set()
+        moved = set()
+        taxonomy_changed = not reusable or bool(removed)
+        for slug in removed:
+            moved.add(('categories', previous[slug]['meta']['category']))
+            moved.update(('tags', tag) for tag in previous[slug]['meta']['tags'])
+        
+        articles = []
+        reused = {}  # Empreinte → slugs des articles repris du build précédent
+        for filepath, source_hash, stat in sources:
+            if filepath in loaded:
+                article, terms = loaded[filepath]
+                loaded[filepath] = article
+                add_postings(postings, terms, article.slug)
+                entry = {
+                    'source_hash': source_hash,
+                    'frontmatter_hash': changed[filepath],
+                    'meta': article_meta(article),
+                }
+                old_meta = previous.get(article.slug, {}).get('meta')
+                if entry['meta'] != old_meta:
+                    meta_changed.add(article.slug)
+                    old_meta = old_meta or dict(dict.fromkeys(META_FIELDS), tags=[])  # Nouvel article
+                    if any(old_meta[field] != entry['meta'][field] for field in ('date', 'category', 'tags')):
+                        moved.update([('categories', old_meta['category']), ('categories', article.category)])
+                        moved.update(('tags', tag) for tag in old_meta['tags'] + article.tags)
+                    taxonomy_changed |= old_meta['reading_time'] != article.reading_time or bool(moved)
+                    search_changed |= any(old_meta[field] != entry['meta'][field]
+                                          for field in ('title', 'category', 'date', 'excerpt'))
+                search_changed |= set(terms) != old_terms.get(article.slug)
+            else:
+                entry = previous[filepath.stem]
+                article = Article(filepath, **entry['meta'])
+                reused.setdefault(source_hash, []).append(article.slug)
+            entries[article.slug] = dict(entry, output=f"articles/{article.slug}.html", stat=stat)
+            articles.append(article)
+        for term, hashes in previous_postings.items():
+            for source_hash in hashes:
+                for slug in reused.get(source_hash, ()):
+                    postings.setdefault(term, set()).add(slug)
+        del previous_postings
+        
+        # Tout le corpus est chargé : indexer avant de rendre
+        taxonomy = build_taxonomy(articles)
+        tag_slugs_map = {name: term['slug'] for name, term in taxonomy['tags'].items()}
+        
+        # Images référencées : copiées et déclinées en variantes avant le rendu des pages qui les décrivent
+        images = build_images(articles, writes, pool, args.jobs)
+        
+        # Articles liés repris du build précédent, sauf pour les articles d'une catégorie ou d'un tag qui a bougé ;
+        # serve reprend aussi la clé de rendu d'une page dont ni la source, ni les articles liés (liste et cartes),
+        # ni les images, ni les slugs des tags n'ont changé
+        affected = {slug for key, name in moved if name in taxonomy[key] for slug in taxonomy[key][name]['articles']}
+        reuse_keys = kept is not None and reusable and kept_images == images and kept_tag_slugs == tag_slugs_map
+        
+        # Sélectionner les pages dont la source ou les voisins ont changé
+        tasks = []
+        skipped = 0
+        for i, article in enumerate(articles):
+            entry = entries[article.slug]
+            old_entry = previous.get(article.slug, {})
+            if 'related' in old_entry and article.slug not in affected:
+                related = [taxonomy['articles'][other] for other in old_entry['related']]
+            else:
+                with profile_stage('articles liés', article.slug):
+                    related = get_related_articles(article, taxonomy)
+            entry['related'] = [other.slug for other in related]
+            article_images = {src: images[src] for src in article.images if src in images}
+            tag_slugs = term_slugs(taxonomy['tags'], article.tags)
+            if not (reuse_keys and 'render_key' in old_entry and article.filepath not in loaded
+                    and entry['related'] == old_entry.get('related') and meta_changed.isdisjoint(entry['related'])):
+                entry['render_key'] = article_render_key(entry['source_hash'], related, article_images, tag_slugs)
+            if old_entry.get('render_key') == entry['render_key'] and (OUTPUT_DIR / entry['output']).exists():
+                skipped += 1
+                writes[False] += 1
+            else:
+                tasks.append((i, related, article_images, tag_slugs))
+        
+        # Source inchangée mais voisins modifiés : le contenu est relu à l'écriture (cache de conversion)
+        for i, *_ in tasks:
+            if articles[i].filepath not in loaded:
+                print(f"  🔗 Mise à jour des liens de {articles[i].filepath.name}...")
+        
+        # Générer les pages des articles (contenu HTML chargé puis libéré page par page)
+        writes.update(map_tasks(pool, write_article_page, [(articles[i], related, assets, article_images, tag_slugs)
+                                                           for i, related, article_images, tag_slugs in tasks],
+                                args.jobs))
+    finally:
+        if pool:
+            pool.shutdown()
+    
+    # Supprimer les pages des articles retirés
+    for slug, entry in manifest.get('articles', {}).items():
+        if slug not in entries:
+            remove_output(entry['output'])
+    
+    print(f"  ✅ {len(articles)} article(s) traité(s), {skipped} inchangé(s)")
+    
+    # Générer les pages de listing : accueil paginé, catégories et tags
+    print("  🏠 Génération de la page d'accueil et des listings...")
+    pages, rendered = write_listing_pages(taxonomy, assets, args.page_size, previous_pages, manifest.get('pages', {}),
+                                          listing_keys, meta_changed)
+    writes.update(rendered.values())
+    writes[False] += len(pages) - len(rendered)
+    print(f"  ✅ {len(pages)} page(s) de listing, {len(pages) - len(rendered)} inchangée(s)")
+    
+    # Index de recherche (chargé par la page au premier focus du champ de recherche)
+    if search_changed or not (OUTPUT_DIR / SEARCH_INDEX_PATH).exists():
+        search_index = build_search_index(taxonomy, postings)
+        writes[write_if_changed(OUTPUT_DIR / SEARCH_INDEX_PATH,
+                                json.dumps(search_index, ensure_ascii=False, separators=(',', ':')))] += 1
+        print(f"  🔍 Index de recherche : {len(search_index['terms'])} termes")
+    else:
+        writes[False] += 1
+        print(f"  🔍 Index de recherche inchangé : {len(postings)} termes")
+    
+    # Taxonomie : catégories et tags avec leurs statistiques
+    if taxonomy_changed or not (OUTPUT_DIR / TAXONOMY_PATH).exists():
+        writes[write_if_changed(OUTPUT_DIR / TAXONOMY_PATH,
+                                json.dumps(taxonomy_data(taxonomy), ensure_ascii=False, indent=1))] += 1
+    else:
+        writes[False] += 1
+    print(f"  🏷️  Taxonomie : {len(taxonomy['categories'])} catégorie(s), {len(taxonomy['tags'])} tag(s)")
+    
+    # Flux Atom et JSON Feed : réécrits seulement si une entrée change (validateurs HTTP stables)
+    feed_entries = plan_feed(taxonomy, args.feed_size)
+    writes[write_if_changed(OUTPUT_DIR / FEED_ATOM_PATH, generate_atom_feed(feed_entries))] += 1
+    writes[write_if_changed(OUTPUT_DIR / FEED_JSON_PATH, generate_json_feed(feed_entries))] += 1
+    print(f"  📡 Flux Atom et JSON : {len(feed_entries)} entrée(s)")
+    
+    # serve purge le cache de conversion au démarrage seulement (il ne grossit ensuite que des sources éditées)
+    pruned = prune_render_cache(args.cache_size * 1024 * 1024) if kept is None else 0
+    if pruned:
+        print(f"  🧹 Cache de conversion : {pruned} entrée(s) ancienne(s) supprimée(s)")
+    
+    # Variantes précompressées : sans --compress, celles d'un build précédent seraient périmées
+    if args.compress:
+        compressed, written = compress_outputs(args.jobs)
+        formats = 'gzip + brotli' if brotli else 'gzip'
+        print(f"  🗜️  Compression ({formats}) : {compressed} fichier(s) recompressé(s), {written} variante(s) écrite(s)")
+    elif manifest.get('compressed'):
+        remove_compressed_outputs()
+    
+    # Listes gardées en mémoire par serve : le cache disque reste celui de son premier build, le build suivant
+    # hors serve reconvertit les sources modifiées entre-temps (leur empreinte n'y est pas)
+    if not kept_postings:
+        save_terms_cache(template_version, postings, entries)
+    manifest = {
+        'template_version': template_version,
+        'assets': assets,
+        'articles': entries,
+        'pages': pages,
+        'compressed': args.compress,
+    }
+    writes[save_manifest(manifest)] += 1
+    if state is not None:
+        state.manifest = manifest
+        state.postings = postings
+        state.images = images
+        state.tag_slugs = tag_slugs_map
+        state.listing_keys = listing_keys
+    
+    print(f"  💾 {writes[True]} fichier(s) écrit(s), {writes[False]} inchangé(s) non réécrit(s)")
+    print("✨ Blog généré avec succès dans le dossier _site/")
+    print(f"📊 Statistiques : {len(articles)} articles, {sum(a.reading_time for a in articles)} min de lecture totales")
+    return articles
+
+def write_listing_pages(taxonomy, assets, page_size, previous_pages, old_pages, keys=None, changed=frozenset()):
+    """Écrit les pages de listing dont la clé de rendu a changé et supprime celles qui n'existent plus ;
+    retourne {chemin: clé de rendu} de toutes les pages et {chemin: True si écrite} des pages rendues.
+    keys : {chemin: (résumé, clé)} du build précédent, mis à jour ; la clé d'une page dont le résumé est le même
+    et dont aucun article n'est dans changed (métadonnées modifiées) est reprise sans être recalculée"""
+    keys = {} if keys is None else keys
+    pages = {}
+    rendered = {}
+    for page in plan_listing_pages(taxonomy, page_size):
+        summary = listing_summary(page)
+        cached = keys.get(page['path'])
+        if cached is None or cached[0] != summary or not changed.isdisjoint(summary['articles']):
+            keys[page['path']] = cached = (summary, listing_render_key(page))
+        pages[page['path']] = cached[1]
+        output_path = OUTPUT_DIR / page['path']
+        if previous_pages.get(page['path']) == pages[page['path']] and output_path.exists():
+            continue
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        rendered[page['path']] = write_rendered_page(output_path, lambda: iter_listing_page(page, assets), page['path'])
+    
+    for path in old_pages:
+        if path not in pages:
+            remove_output(path)
+    for path in keys.keys() - pages.keys():
+        del keys[path]
+    return pages, rendered
+
+def load_meta_cache(template_version):
+    """Métadonnées lues par scan_article lors des builds --only index précédents avec le même générateur
+    (vide si absent, illisible ou périmé)"""
+    try:
+        cache = json.loads(META_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return cache.get('articles', {}) if cache.get('template_version') == template_version else {}
+
+def build_index_only(args):
+    """--only index : régénère les pages de listing sans convertir les articles ; retourne None sans build complet à jour.
+    Les métadonnées viennent du manifeste si la source n'a pas bougé (mtime et taille), sinon de scan_article (en cache)"""
+    manifest = load_manifest()
+    assets = manifest.get('assets')
+    if not assets or compute_template_version(assets) != manifest.get('template_version'):
+        return None
+    
+    cache = load_meta_cache(manifest['template_version'])
+    scanned = {}
     articles = []
+    for filepath in list_article_sources():
+        slug, stat = filepath.stem, source_stat(filepath)
+        entry = manifest['articles'].get(slug)
+        if not entry or entry.get('stat') != stat:
+            entry = cache.get(slug)
+            if not entry or entry['stat'] != stat:
+                print(f"  📄 Lecture des métadonnées de {filepath.name}...")
+                with profile_stage('métadonnées', slug):
+                    entry = {'stat': stat, 'meta': scan_article(filepath)}
+            scanned[slug] = entry
+        articles.append(Article(filepath, **entry['meta']))
+    
+    # Cache limité aux sources qui diffèrent du dernier build complet
+    META_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(META_CACHE_PATH, json.dumps({'template_version': manifest['template_version'], 'articles': scanned},
+                                                 ensure_ascii=False, sort_keys=True))
+    
+    print("  🏠 Génération de la page d'accueil et des listings...")
+    taxonomy = build_taxonomy(articles)
+    pages, rendered = write_listing_pages(taxonomy, assets, args.page_size, {}, manifest.get('pages', {}))
+    written = [path for path, changed in rendered.items() if changed]
+    print(f"  ✅ {len(pages)} page(s) de listing, {len(written)} modifiée(s)")
+    if manifest.get('compressed'):
+        for path in written:
+            compress_file(OUTPUT_DIR / path)
+    
+    # Pages réécrites d'après des métadonnées lues partiellement : le prochain build complet les régénère
+    old_pages = manifest.get('pages', {})
+    kept_pages = {path: key for path, key in old_pages.items() if path in pages and path not in written}
+    if kept_pages != old_pages:
+        manifest['pages'] = kept_pages
+        save_manifest(manifest)
+    print("✨ Pages de listing régénérées dans le dossier _site/")
+    return articles
+
+def profile_build(args):
+    """Build instrumenté : rapport par étape et par article, et export cProfile optionnel"""
+    global PROFILER
+    PROFILER = BuildProfiler()
+    profile = cProfile.Profile() if args.profile_out else None
+    if profile:
+        profile.enable()
+    try:
+        with profile_stage('build total'):
+            articles = build(args)
+    finally:
+        if profile:
+            profile.disable()
+            profile.dump_stats(args.profile_out)
+            print(f"📈 Profil cProfile enregistré dans {args.profile_out} (processus principal uniquement)")
+    PROFILER.report({article.slug for article in articles}, args.profile_top)
+    PROFILER = None
+
+class LiveReload:
+    """Compteur de builds partagé entre le surveillant de fichiers et les connexions SSE"""
+    
+    def __init__(self):
+        self.generation = 0
+        self.condition = threading.Condition()
+    
+    def notify(self):
+        with self.condition:
+            self.generation += 1
+            self.condition.notify_all()
+    
+    def wait(self, generation, timeout):
+        """Attend un build plus récent que generation ; retourne la génération courante"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.generation != generation, timeout=timeout)
+            return self.generation
+
+class DevServerHandler(SimpleHTTPRequestHandler):
+    """Sert _site/ et injecte dans chaque page HTML le client de rechargement automatique"""
+    
+    live_reload = None
+    
+    def do_GET(self):
+        if self.path == LIVE_RELOAD_PATH:
+            self.stream_reloads()
+            return
+        
+        path = Path(self.translate_path(self.path))
+        if self.path.split('?', 1)[0].endswith('/'):
+            path = path / 'index.html'
+        if path.suffix != '.html' or not path.is_file():
+            super().do_GET()
+            return
+        
+        body = path.read_bytes().replace(b'</body>', LIVE_RELOAD_SCRIPT + b'</body>', 1)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def stream_reloads(self):
+        """Flux SSE : un événement reload après chaque reconstruction"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        generation = self.live_reload.generation
+        try:
+            while True:
+                current = self.live_reload.wait(generation, timeout=15)
+                if current != generation:
+                    generation = current
+                    self.wfile.write(b'data: reload\n\n')
+                else:
+                    self.wfile.write(b': ping\n\n')  # garde la connexion ouverte
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+def watched_paths():
+    """Dossiers et fichiers surveillés par serve : articles et leurs images, CSS/JS partagés et gabarits.
+    Un fichier ajouté, supprimé ou renommé change le mtime de son dossier : la liste n'est refaite qu'alors"""
+    directories = [TEMPLATES_DIR, ARTICLES_DIR]
+    files = [ASSETS_DIR / name for name in SITE_ASSETS.values()] + list(TEMPLATES_DIR.glob("*.html"))
     if ARTICLES_DIR.exists():
-        for filepath in ARTICLES_DIR.glob("*.md"):
-            if not filepath.name.startswith('_'):  # Ignorer les fichiers commençant par _
-                print(f"  📄 Traitement de {filepath.name}...")
-                article = load_article(filepath)
-                articles.append(article)
-                
-                # Générer la page de l'article
-                article_html = generate_article_page(article, articles)
-                output_path = ARTICLES_OUTPUT / f"{article['slug']}.html"
-                output_path.write_text(article_html, encoding='utf-8')
-    
-    print(f"  ✅ {len(articles)} article(s) traité(s)")
-    
-    # Générer la page d'accueil
-    print("  🏠 Génération de la page d'accueil...")
-    index_html = generate_index_page(articles)
-    (OUTPUT_DIR / "index.html").write_text(index_html, encoding='utf-8')
+        for path in ARTICLES_DIR.rglob("*"):
+            if path.is_dir():
+                directories.append(path)
+            elif path.suffix.lower() in IMAGE_SUFFIXES or path.parent == ARTICLES_DIR and path.suffix == '.md':
+                files.append(path)
+    return [str(path) for path in directories], [str(path) for path in files]
+
+def stat_snapshot(paths):
+    """mtime et taille de chaque chemin (None s'il n'existe pas)"""
+    snapshot = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            snapshot.append(None)
+            continue
+        snapshot.append((stat.st_mtime_ns, stat.st_size))
+    return snapshot
+
+def watch_and_rebuild(args, live_reload, state):
+    """Surveille les sources par scrutation et reconstruit le site à chaque modification"""
+    directories, files = watched_paths()
+    listing = stat_snapshot(directories)
+    snapshot = dict(zip(files, stat_snapshot(files)))
+    while True:
+        time.sleep(WATCH_INTERVAL)
+        current_listing = stat_snapshot(directories)
+        if current_listing != listing:
+            directories, files = watched_paths()
+            listing = stat_snapshot(directories)
+        current = dict(zip(files, stat_snapshot(files)))
+        if current == snapshot:
+            continue
+        snapshot = current
+        start = time.perf_counter()
+        try:
+            build(args, state)
+        except Exception:
+            traceback.print_exc()
+            continue
+        live_reload.notify()
+        print(f"🔄 Reconstruit en {(time.perf_counter() - start) * 1000:.0f} ms")
+
+def serve(args):
+    """Serveur de développement : sert _site/, reconstruit à chaud et recharge les navigateurs ouverts"""
+    args.incremental = True
+    state = BuildState()
+    build(args, state)
     
-    print("✨ Blog généré avec succès dans le dossier _site/")
-    print(f"📊 Statistiques : {len(articles)} articles, {sum(a['reading_time'] for a in articles)} min de lecture totales")
+    live_reload = LiveReload()
+    watcher = threading.Thread(target=watch_and_rebuild, args=(args, live_reload, state), daemon=True)
+    watcher.start()
+    
+    handler = functools.partial(DevServerHandler, directory=str(OUTPUT_DIR))
+    DevServerHandler.live_reload = live_reload
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    print(f"🌐 Serveur de développement sur http://{args.host}:{args.port}/ (Ctrl+C pour arrêter)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Arrêt du serveur")
+    finally:
+        server.server_close()
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    if args.command == 'serve':
+        serve(args)
+    elif args.command == 'fetch-fonts':
+        print("🔤 Téléchargement des polices dans _vendor/fonts/...")
+        if fetch_vendor_fonts():
+            raise SystemExit(1)
+    else:
+        if args.profile or args.profile_out:
+            profile_build(args)
+        else:
+            build(args)
+        if args.check_links and check_links(args.jobs):
+            raise SystemExit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
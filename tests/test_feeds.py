@@ -0,0 +1,42 @@
+"""
+Flux Atom et JSON : un extrait contenant « & » et « < » est restitué échappé une seule fois
+"""
+
+import io
+import sys
+import json
+import contextlib
+from pathlib import Path
+from xml.etree import ElementTree
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import generate
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+ARTICLE = """---
+title: Filtrage chez AT&T
+date: 2025-03-01
+category: Web Security
+---
+
+AT&T filtre les balises &lt;script&gt; et `<iframe>` dans les formulaires.
+"""
+EXPECTED = "AT&T filtre les balises <script> et <iframe> dans les formulaires."
+
+def build_site(tmp_path, monkeypatch):
+    """Build d'un site d'un article dans tmp_path ; retourne le dossier _site/"""
+    (tmp_path / "_articles").mkdir()
+    (tmp_path / "_articles" / "att.md").write_text(ARTICLE, encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate.main([])
+    return tmp_path / "_site"
+
+def test_feed_summaries_are_escaped_once(tmp_path, monkeypatch):
+    site = build_site(tmp_path, monkeypatch)
+    atom = ElementTree.parse(site / generate.FEED_ATOM_PATH).getroot()
+    assert atom.find(f'{ATOM}entry/{ATOM}summary').text == EXPECTED
+
+    item = json.loads((site / generate.FEED_JSON_PATH).read_text(encoding='utf-8'))['items'][0]
+    assert item['summary'] == EXPECTED
+    assert item['content_text'] == EXPECTED